@@ -1,12 +1,38 @@
+from array import array
+
+
+def _typed_empty(typecode: str):
+    """Нулевое значение для typecode: из нулевых байтов, поэтому подходит и для 'u'/'w'"""
+    arr = array(typecode)
+    arr.frombytes(bytes(arr.itemsize))
+    return arr[0]
+
+
 class StaticArray:
 
-    def __init__(self, capacity: int):
+    def __init__(self, capacity: int, typecode: str = None):
+        """
+        typecode=None — обычный режим: список произвольных объектов.
+        typecode="q", "d", ... — типизированный режим: элементы хранятся в
+        непрерывном буфере array.array без упаковки в объекты Python,
+        поиск выполняется на C, данные можно отдать через memoryview без копирования.
+        """
         if capacity <= 0:
             raise ValueError("Capacity must be positive")
         self._capacity = capacity
-        self._arr = [None] * capacity
+        self._typecode = typecode
+        if typecode is None:
+            self._empty = None
+            self._arr = [None] * capacity
+        else:
+            self._empty = _typed_empty(typecode)
+            self._arr = array(typecode, [self._empty]) * capacity
         self._size = 0
 
+    @property
+    def typecode(self):
+        return self._typecode
+
     def is_full(self) -> bool:
         return self._size == self._capacity
 
@@ -17,7 +43,7 @@ class StaticArray:
         return self._size
 
     def __str__(self):
-        elements = self._arr[:self._size]
+        elements = list(self._arr[:self._size])
         return f"StaticArray({elements}, size={self._size}, capacity={self._capacity})"
 
     def pushBack(self, value) -> bool:
@@ -36,12 +62,11 @@ class StaticArray:
         """
         Добавляет элемент в начало массива.
         Трудоёмкость: O(n) — требуется сдвинуть все n существующих элементов на 1 позицию вправо.
-        В худшем случае (массив почти полный) — ~n операций копирования.
+        Сдвиг выполняется одним срезовым присваиванием (блочное копирование на C).
         """
         if self.is_full():
             return False
-        for i in range(self._size - 1, -1, -1):
-            self._arr[i + 1] = self._arr[i]
+        self._arr[1:self._size + 1] = self._arr[0:self._size]
         self._arr[0] = value
         self._size += 1
         return True
@@ -51,14 +76,14 @@ class StaticArray:
         Вставляет элемент по указанному индексу.
         Трудоёмкость: O(n) — в худшем случае (вставка в начало) нужно сдвинуть все n элементов.
         В среднем — сдвиг (n - index) элементов → всё равно линейная зависимость от n.
+        Хвост сдвигается одним срезовым присваиванием.
         """
         if index < 0 or index > self._size:
             raise IndexError("Index out of bounds for insert")
         if self.is_full():
             return False
 
-        for i in range(self._size - 1, index - 1, -1):
-            self._arr[i + 1] = self._arr[i]
+        self._arr[index + 1:self._size + 1] = self._arr[index:self._size]
         self._arr[index] = value
         self._size += 1
         return True
@@ -74,26 +99,288 @@ class StaticArray:
 
         removed_value = self._arr[index]
 
-        for i in range(index, self._size - 1):
-            self._arr[i] = self._arr[i + 1]
+        self._arr[index:self._size - 1] = self._arr[index + 1:self._size]
 
-        self._arr[self._size - 1] = None
+        self._arr[self._size - 1] = self._empty
         self._size -= 1
 
         return removed_value
 
+    def insert_many(self, index: int, values) -> bool:
+        """
+        Вставляет пачку элементов начиная с index.
+        Трудоёмкость: O(n + k) — хвост сдвигается один раз на k позиций,
+        а не k раз на одну позицию.
+        Если пачка не помещается, массив не изменяется и возвращается False.
+        """
+        if index < 0 or index > self._size:
+            raise IndexError("Index out of bounds for insert")
+        values = list(values)
+        k = len(values)
+        if self._size + k > self._capacity:
+            return False
+        if self._typecode is not None:
+            values = array(self._typecode, values)
+
+        self._arr[index + k:self._size + k] = self._arr[index:self._size]
+        self._arr[index:index + k] = values
+        self._size += k
+        return True
+
+    def remove_range(self, start: int, stop: int) -> list:
+        """
+        Удаляет элементы с индексами [start, stop) и возвращает их списком.
+        Трудоёмкость: O(n) — хвост сдвигается влево один раз на всю пачку.
+        """
+        if start < 0 or stop > self._size or start > stop:
+            raise IndexError("Range out of bounds for remove")
+        k = stop - start
+        removed = list(self._arr[start:stop])
+
+        self._arr[start:self._size - k] = self._arr[stop:self._size]
+        self._arr[self._size - k:self._size] = self._filler(k)
+        self._size -= k
+        return removed
+
+    def _filler(self, k: int):
+        if self._typecode is None:
+            return [None] * k
+        return array(self._typecode, [self._empty]) * k
+
     def find(self, value) -> int:
         """
         Ищет первое вхождение значения и возвращает его индекс.
         Трудоёмкость: O(n) — линейный поиск: в худшем случае (элемента нет или он последний)
-        просматриваем все n элементов.
+        просматриваем все n элементов. Сам проход выполняется на C (index).
+        """
+        try:
+            return self._arr.index(value, 0, self._size)
+        except ValueError:
+            return -1
+        except (TypeError, OverflowError):
+            # значение несовместимого типа в типизированном буфере; в обычном режиме
+            # это исключение из пользовательского __eq__, его не скрываем
+            if self._typecode is None:
+                raise
+            return -1
+
+    def memoryview(self) -> memoryview:
+        """
+        Возвращает memoryview на заполненную часть буфера без копирования.
+        Доступно только в типизированном режиме.
+        """
+        if self._typecode is None:
+            raise TypeError("memoryview is available only for typed StaticArray")
+        return memoryview(self._arr)[:self._size]
+
+
+class GapBufferArray:
+    """
+    Массив фиксированной ёмкости на кольцевом буфере с «зазором» (gap buffer).
+    Свободные ячейки образуют один непрерывный (по кольцу) зазор, который стоит
+    между элементами с логическими индексами gap-1 и gap. Вставка и удаление
+    выполняются на краю зазора, поэтому стоят O(расстояние, на которое сдвигается зазор).
+    Начало и конец массива соседствуют через зазор, так что pushFront/pushBack — O(1),
+    пока правки не переносят зазор в середину.
+    API совпадает со StaticArray.
+    """
+
+    def __init__(self, capacity: int, typecode: str = None):
+        if capacity <= 0:
+            raise ValueError("Capacity must be positive")
+        self._capacity = capacity
+        self._typecode = typecode
+        if typecode is None:
+            self._empty = None
+            self._arr = [None] * capacity
+        else:
+            self._empty = _typed_empty(typecode)
+            self._arr = array(typecode, [self._empty]) * capacity
+        self._size = 0
+        self._start = 0  # физический индекс логического элемента 0 (если зазор не перед ним)
+        self._gap = 0    # логическая позиция зазора: 0..size
+
+    def is_full(self) -> bool:
+        return self._size == self._capacity
+
+    def is_empty(self) -> bool:
+        return self._size == 0
+
+    def __len__(self):
+        return self._size
+
+    def __iter__(self):
+        arr = self._arr
+        for start, stop in self._segments():
+            yield from arr[start:stop]
+
+    def __str__(self):
+        return f"GapBufferArray({list(self)}, size={self._size}, capacity={self._capacity})"
+
+    def _gap_len(self) -> int:
+        return self._capacity - self._size
+
+    def _segments(self):
+        """Непрерывные физические отрезки с элементами в логическом порядке."""
+        cap = self._capacity
+        runs = ((self._start, self._gap),
+                (self._start + self._gap + self._gap_len(), self._size - self._gap))
+        for phys, count in runs:
+            if count == 0:
+                continue
+            phys %= cap
+            if phys + count <= cap:
+                yield phys, phys + count
+            else:
+                yield phys, cap
+                yield 0, phys + count - cap
+
+    def _jump(self, gap: int) -> None:
+        """
+        Зазор на позиции 0 и на позиции size — одна и та же физическая раскладка
+        (кольцо), различается только отсчёт начала. Переход бесплатный.
         """
-        for i in range(self._size):
-            if self._arr[i] == value:
-                return i
+        if gap == self._gap:
+            return
+        if gap == 0:
+            self._start = (self._start - self._gap_len()) % self._capacity
+        else:
+            self._start = (self._start + self._gap_len()) % self._capacity
+        self._gap = gap
+
+    def _move_gap(self, index: int) -> None:
+        """
+        Переносит зазор на логическую позицию index.
+        Трудоёмкость: O(min(d, n - d)), где d — расстояние от текущего положения зазора:
+        зазор идёт по кольцу в ту сторону, где ближе.
+        """
+        d = index - self._gap
+        if abs(d) * 2 > self._size:
+            if d > 0:
+                self._shift_gap(0)
+                self._jump(self._size)
+            else:
+                self._shift_gap(self._size)
+                self._jump(0)
+        self._shift_gap(index)
+
+    def _shift_gap(self, index: int) -> None:
+        """Прямой перенос зазора без обхода по кольцу: O(|index - gap|)."""
+        arr, cap, start, gl = self._arr, self._capacity, self._start, self._gap_len()
+        if gl == 0:
+            self._gap = index
+            return
+        if self._gap < index:
+            for j in range(self._gap, index):
+                src = (start + j + gl) % cap
+                arr[(start + j) % cap] = arr[src]
+                arr[src] = self._empty
+        else:
+            for j in range(self._gap - 1, index - 1, -1):
+                src = (start + j) % cap
+                arr[(start + j + gl) % cap] = arr[src]
+                arr[src] = self._empty
+        self._gap = index
+
+    def pushBack(self, value) -> bool:
+        """
+        Добавляет элемент в конец.
+        Трудоёмкость: O(1), если зазор стоит на границе начала/конца (обычный случай),
+        иначе O(расстояние до границы).
+        """
+        return self.insert(self._size, value)
+
+    def pushFront(self, value) -> bool:
+        """
+        Добавляет элемент в начало.
+        Трудоёмкость: O(1), если зазор стоит на границе начала/конца (обычный случай),
+        иначе O(расстояние до границы).
+        """
+        return self.insert(0, value)
+
+    def insert(self, index: int, value) -> bool:
+        """
+        Вставляет элемент по указанному индексу.
+        Трудоёмкость: O(расстояние от предыдущей правки) — локальные правки дешёвые.
+        """
+        if index < 0 or index > self._size:
+            raise IndexError("Index out of bounds for insert")
+        if self.is_full():
+            return False
+
+        if index == 0 and self._gap in (0, self._size):
+            # Пишем в правый край зазора — зазор остаётся перед началом массива.
+            self._jump(0)
+            self._arr[(self._start + self._gap_len() - 1) % self._capacity] = value
+        else:
+            self._move_gap(index)
+            self._arr[(self._start + index) % self._capacity] = value
+            self._gap = index + 1
+        self._size += 1
+        return True
+
+    def remove(self, index: int):
+        """
+        Удаляет элемент по индексу и возвращает его.
+        Трудоёмкость: O(расстояние от предыдущей правки).
+        """
+        if index < 0 or index >= self._size:
+            raise IndexError("Index out of bounds for remove")
+
+        self._move_gap(index)
+        pos = (self._start + index + self._gap_len()) % self._capacity
+        removed_value = self._arr[pos]
+        self._arr[pos] = self._empty
+        self._size -= 1
+        return removed_value
+
+    def find(self, value) -> int:
+        """
+        Ищет первое вхождение значения и возвращает его индекс.
+        Трудоёмкость: O(n) — не более четырёх проходов index() на C по отрезкам буфера.
+        """
+        offset = 0
+        for start, stop in self._segments():
+            try:
+                return offset + self._arr.index(value, start, stop) - start
+            except ValueError:
+                offset += stop - start
+            except (TypeError, OverflowError):
+                if self._typecode is None:
+                    raise
+                offset += stop - start
         return -1
 
 
+def benchmark(n: int = 20000):
+    """Сравнение StaticArray и GapBufferArray на «редакторских» сценариях."""
+    import random
+    import time
+
+    for cls in (StaticArray, GapBufferArray):
+        arr = cls(n)
+        start = time.time()
+        for i in range(n):
+            arr.pushFront(i)
+        front = time.time() - start
+
+        arr = cls(n)
+        for i in range(n // 2):
+            arr.pushBack(i)
+        cursor = len(arr) // 2
+        start = time.time()
+        for _ in range(n // 2):
+            cursor = max(0, min(len(arr) - 1, cursor + random.randint(-3, 3)))
+            if random.random() < 0.5:
+                arr.insert(cursor, 0)
+            else:
+                arr.remove(cursor)
+        edits = time.time() - start
+
+        print(f"{cls.__name__:>15}: {n} pushFront — {front:.4f} сек, "
+              f"{n // 2} правок у курсора — {edits:.4f} сек")
+
+
 if __name__ == "__main__":
     sa = StaticArray(5)
 
@@ -121,4 +408,33 @@ if __name__ == "__main__":
 
     print("\n переполнение")
     print("PushBack 99:", sa.pushBack(99))
-    print("PushBack 100:", sa.pushBack(100))
\ No newline at end of file
+    print("PushBack 100:", sa.pushBack(100))
+
+    print("\n пакетные операции")
+    ba = StaticArray(10)
+    ba.insert_many(0, [1, 2, 3])
+    ba.insert_many(1, [10, 11])
+    print(ba)
+    print("remove_range(1, 3):", ba.remove_range(1, 3), ba)
+
+    print("\n типизированный режим")
+    ta = StaticArray(5, typecode="q")
+    for x in (1, 2, 3):
+        ta.pushBack(x)
+    ta.pushFront(0)
+    print(ta)
+    print("Index of 2:", ta.find(2))
+    view = ta.memoryview()
+    print("memoryview:", view.tolist(), "itemsize:", view.itemsize)
+
+    print("\n gap buffer")
+    ga = GapBufferArray(5)
+    ga.pushBack(2)
+    ga.pushFront(1)
+    ga.pushFront(0)
+    ga.insert(3, 3)
+    print(ga)
+    print("Removed:", ga.remove(1), ga)
+
+    print("\n сравнение производительности")
+    benchmark()
@@ -1,37 +1,252 @@
+import json
+import struct
 import time
+from array import array
+from collections.abc import MutableSequence
+from itertools import islice
 
 
-class SimpleDynamicArray:
+def grow_double(capacity: int, needed: int) -> int:
+    """Рост в 2 раза"""
+    return max(needed, 2 * capacity)
+
+
+def grow_one_and_half(capacity: int, needed: int) -> int:
+    """Рост в 1.5 раза"""
+    return max(needed, capacity + (capacity >> 1) + 1)
+
+
+def grow_cpython(capacity: int, needed: int) -> int:
+    """Переаллокация как у list в CPython: needed + needed/8 + 6, кратно 4"""
+    return (needed + (needed >> 3) + 6) & ~3
+
+
+POINTER_SIZE = struct.calcsize("P")
+BENCH_SIZES = (10 ** 3, 10 ** 4, 10 ** 5, 10 ** 6, 10 ** 7)
+
+
+class SimpleDynamicArray(MutableSequence):
     """Упрощенная реализация динамического массива"""
 
-    def __init__(self, capacity=1):
+    def __init__(self, capacity=1, growth=grow_double, shrink_ratio=0.25):
+        """
+        growth — функция (capacity, needed) -> новая ёмкость.
+        shrink_ratio — если после удаления заполненность падает ниже этой доли,
+        ёмкость уменьшается вдвое (гистерезис: рост при 100%, сжатие при 25%,
+        поэтому чередование append/pop на границе не вызывает лавину копирований).
+        None отключает сжатие. Сжатие не опускает ёмкость ниже значения,
+        заказанного через reserve (до вызова shrink_to_fit).
+        """
         self._capacity = max(1, capacity)
         self._size = 0
         self._array = [None] * self._capacity
+        self._growth = growth
+        self._shrink_ratio = shrink_ratio
+        self._reserved = 0
+        self._resizes = 0
+        self._copied = 0
 
     def append(self, element):
         if self._size == self._capacity:
-            self._resize(2 * self._capacity)
+            self._resize(self._growth(self._capacity, self._size + 1))
         self._array[self._size] = element
         self._size += 1
 
     def _resize(self, new_capacity):
-        new_array = [None] * new_capacity
-        for i in range(self._size):
-            new_array[i] = self._array[i]
-        self._array = new_array
+        new_capacity = max(1, new_capacity, self._size)
+        self._resizes += 1
+        self._copied += self._size
+        if new_capacity > self._capacity:
+            self._array = self._array[:self._size] + [None] * (new_capacity - self._size)
+        else:
+            self._array = self._array[:new_capacity]
         self._capacity = new_capacity
 
+    def _maybe_shrink(self):
+        if self._shrink_ratio is None:
+            return
+        new_capacity = self._capacity
+        while new_capacity > 1 and self._size < new_capacity * self._shrink_ratio:
+            new_capacity //= 2
+        new_capacity = max(new_capacity, self._reserved)
+        if new_capacity != self._capacity:
+            self._resize(new_capacity)
+
+    def _grow_to(self, needed):
+        if needed > self._capacity:
+            self._resize(self._growth(self._capacity, needed))
+
+    def _normalize(self, index):
+        if index < 0:
+            index += self._size
+        if index < 0 or index >= self._size:
+            raise IndexError("array index out of range")
+        return index
+
+    def _assign(self, items):
+        """
+        Заменяет содержимое списком items (используется срезовыми операциями).
+        Буфер при этом собирается заново, поэтому копирование учитывается в stats(),
+        а рост ёмкости считается перевыделением.
+        """
+        self._size = len(items)
+        if self._size > self._capacity:
+            self._capacity = self._growth(self._capacity, self._size)
+            self._resizes += 1
+        self._copied += self._size
+        self._array = items + [None] * (self._capacity - self._size)
+        self._maybe_shrink()
+
+    def extend(self, values):
+        """
+        Добавляет все элементы за одно расширение буфера и одно срезовое копирование.
+        Размер пачки берётся из len(); итераторы без длины сначала собираются в список.
+        """
+        if not isinstance(values, (list, tuple)):
+            values = list(values)
+        k = len(values)
+        self._grow_to(self._size + k)
+        self._array[self._size:self._size + k] = values
+        self._size += k
+
+    def insert(self, index, element):
+        """Вставка со сдвигом хвоста одним срезом; индекс обрезается как у list.insert"""
+        if index < 0:
+            index = max(0, index + self._size)
+        index = min(index, self._size)
+        self._grow_to(self._size + 1)
+        self._array[index + 1:self._size + 1] = self._array[index:self._size]
+        self._array[index] = element
+        self._size += 1
+
+    def pop(self, index=-1):
+        if self._size == 0:
+            raise IndexError("pop from empty array")
+        index = self._normalize(index)
+        element = self._array[index]
+        self._array[index:self._size - 1] = self._array[index + 1:self._size]
+        self._size -= 1
+        self._array[self._size] = None
+        self._maybe_shrink()
+        return element
+
+    def reserve(self, n):
+        """
+        Гарантирует ёмкость не меньше n (одно копирование вместо нескольких ростов).
+        Пока не вызван shrink_to_fit, удаления не сжимают массив ниже n.
+        """
+        self._reserved = max(self._reserved, n)
+        if n > self._capacity:
+            self._resize(n)
+
+    def shrink_to_fit(self):
+        """Уменьшает ёмкость до текущего размера и снимает резерв"""
+        self._reserved = 0
+        if self._capacity > self._size:
+            self._resize(self._size)
+
+    def capacity(self):
+        return self._capacity
+
+    def stats(self):
+        """Счётчики перевыделений: число resize и объём скопированных ссылок"""
+        return {
+            "resizes": self._resizes,
+            "copied_items": self._copied,
+            "copied_bytes": self._copied * POINTER_SIZE,
+        }
+
     def __len__(self):
         return self._size
 
     def __getitem__(self, index):
-        return self._array[index]
+        if isinstance(index, slice):
+            items = self._array[:self._size][index]
+            result = SimpleDynamicArray(len(items), self._growth, self._shrink_ratio)
+            result.extend(items)
+            return result
+        return self._array[self._normalize(index)]
+
+    def __setitem__(self, index, element):
+        if isinstance(index, slice):
+            items = self._array[:self._size]
+            items[index] = element
+            self._assign(items)
+        else:
+            self._array[self._normalize(index)] = element
+
+    def __delitem__(self, index):
+        if isinstance(index, slice):
+            items = self._array[:self._size]
+            del items[index]
+            self._assign(items)
+        else:
+            self.pop(index)
+
+    def __iter__(self):
+        return islice(self._array, self._size)
 
     def __str__(self):
         return str(self._array[:self._size])
 
 
+def _percentile(sorted_values, p):
+    return sorted_values[min(len(sorted_values) - 1, int(len(sorted_values) * p))]
+
+
+def measure_appends(factory, n):
+    """
+    Засекает время каждого append (нс) для контейнера, созданного factory().
+    Возвращает p50/p99/max латентности, суммарное время и, если контейнер
+    умеет stats(), счётчики перевыделений.
+    """
+    container = factory()
+    append = container.append
+    latencies = array("q", bytes(8 * n))
+    clock = time.perf_counter_ns
+    total_start = clock()
+    for i in range(n):
+        start = clock()
+        append(i)
+        latencies[i] = clock() - start
+    total = clock() - total_start
+
+    ordered = sorted(latencies)
+    result = {
+        "n": n,
+        "total_sec": total / 1e9,
+        "p50_ns": _percentile(ordered, 0.50),
+        "p99_ns": _percentile(ordered, 0.99),
+        "max_ns": ordered[-1],
+    }
+    if hasattr(container, "stats"):
+        result.update(container.stats())
+    return result
+
+
+def benchmark(sizes=BENCH_SIZES):
+    """Сравнивает SimpleDynamicArray (разные политики роста), list и array.array"""
+    factories = {
+        "SimpleDynamicArray[grow_double]": lambda: SimpleDynamicArray(growth=grow_double),
+        "SimpleDynamicArray[grow_one_and_half]": lambda: SimpleDynamicArray(growth=grow_one_and_half),
+        "SimpleDynamicArray[grow_cpython]": lambda: SimpleDynamicArray(growth=grow_cpython),
+        "list": list,
+        "array('q')": lambda: array("q"),
+    }
+    results = []
+    for n in sizes:
+        for name, factory in factories.items():
+            row = measure_appends(factory, n)
+            row["container"] = name
+            results.append(row)
+    return results
+
+
+def benchmark_json(sizes=BENCH_SIZES):
+    """Результаты benchmark() в JSON для отслеживания регрессий"""
+    return json.dumps(benchmark(sizes), indent=2)
+
+
 if __name__ == "__main__":
 
     n = 100000
@@ -48,8 +263,31 @@ if __name__ == "__main__":
         dynamic.append(i)
     print(f"Динамический: {time.time() - start:.4f} сек")
 
+    start = time.time()
+    bulk = SimpleDynamicArray()
+    bulk.extend(range(n))
+    print(f"Динамический (extend): {time.time() - start:.4f} сек")
+
     start = time.time()
     py_list = []
     for i in range(n):
         py_list.append(i)
-    print(f"Python list: {time.time() - start:.4f} сек")
\ No newline at end of file
+    print(f"Python list: {time.time() - start:.4f} сек")
+
+    print("\nПолитики роста (ёмкость после 1000 append):")
+    for growth in (grow_double, grow_one_and_half, grow_cpython):
+        arr = SimpleDynamicArray(growth=growth)
+        for i in range(1000):
+            arr.append(i)
+        print(f"  {growth.__name__}: {arr.capacity()}")
+
+    while len(arr) > 10:
+        arr.pop()
+    print(f"После удаления до 10 элементов: ёмкость {arr.capacity()}")
+    arr.shrink_to_fit()
+    print(f"После shrink_to_fit: ёмкость {arr.capacity()}")
+    arr.reserve(500)
+    print(f"После reserve(500): ёмкость {arr.capacity()}")
+
+    print("\nЛатентность append (JSON):")
+    print(benchmark_json(BENCH_SIZES[:3]))
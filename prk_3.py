@@ -1,28 +1,62 @@
 class SimpleLinkedList:
     class Node:
+        __slots__ = ("data", "next")
+
         def __init__(self, data):
             self.data = data
             self.next = None
 
     def __init__(self):
         self.head = None
+        self.tail = None
+        self._length = 0
+
+    def __len__(self):
+        return self._length
+
+    def __iter__(self):
+        current = self.head
+        while current:
+            yield current.data
+            current = current.next
 
     def insert_front(self, data):
         new_node = self.Node(data)
         new_node.next = self.head
         self.head = new_node
+        if self.tail is None:
+            self.tail = new_node
+        self._length += 1
 
     def append(self, data):
         new_node = self.Node(data)
 
         if not self.head:
-            self.head = new_node
-            return
+            self.head = self.tail = new_node
+        else:
+            self.tail.next = new_node
+            self.tail = new_node
+        self._length += 1
 
-        current = self.head
-        while current.next:
-            current = current.next
-        current.next = new_node
+    def extend(self, iterable):
+        """Связывает всю пачку в цепочку за один проход и прицепляет её к хвосту"""
+        Node = self.Node
+        dummy = Node(None)
+        last = dummy
+        count = 0
+        for data in iterable:
+            node = Node(data)
+            last.next = node
+            last = node
+            count += 1
+        if not count:
+            return
+        if self.head:
+            self.tail.next = dummy.next
+        else:
+            self.head = dummy.next
+        self.tail = last
+        self._length += count
 
     def remove(self, data):
         if not self.head:
@@ -30,12 +64,18 @@ class SimpleLinkedList:
 
         if self.head.data == data:
             self.head = self.head.next
+            if self.head is None:
+                self.tail = None
+            self._length -= 1
             return True
 
         current = self.head
         while current.next:
             if current.next.data == data:
+                if current.next is self.tail:
+                    self.tail = current
                 current.next = current.next.next
+                self._length -= 1
                 return True
             current = current.next
 
@@ -63,15 +103,288 @@ class SimpleLinkedList:
             prev = current
             current = next_node
 
+        self.tail = self.head
         self.head = prev
 
+    @staticmethod
+    def _merge(a, b, key):
+        """Сливает две отсортированные цепочки, возвращает (голова, хвост)"""
+        dummy = SimpleLinkedList.Node(None)
+        last = dummy
+        while a and b:
+            if key(b.data) < key(a.data):
+                last.next = b
+                b = b.next
+            else:
+                last.next = a
+                a = a.next
+            last = last.next
+        last.next = a if a else b
+        while last.next:
+            last = last.next
+        return dummy.next, last
+
+    def sort(self, key=None):
+        """
+        Восходящая (bottom-up) сортировка слиянием: O(n log n), O(1) доп. памяти.
+        Перевязывает существующие узлы, новые не создаются. Сортировка устойчивая.
+        """
+        if key is None:
+            key = lambda x: x
+        width = 1
+        while width < self._length:
+            dummy = self.Node(None)
+            joined = dummy
+            current = self.head
+            while current:
+                left = current
+                for _ in range(width - 1):
+                    if not current.next:
+                        break
+                    current = current.next
+                right = current.next
+                current.next = None
+                current = right
+                for _ in range(width - 1):
+                    if not current or not current.next:
+                        break
+                    current = current.next
+                if current:
+                    rest = current.next
+                    current.next = None
+                    current = rest
+                head, tail = self._merge(left, right, key)
+                joined.next = head
+                joined = tail
+            self.head = dummy.next
+            self.tail = joined
+            width *= 2
+
+    def dedup(self):
+        """Удаляет повторы, оставляя первое вхождение. O(n) с хэш-множеством"""
+        seen = set()
+        prev = None
+        current = self.head
+        while current:
+            if current.data in seen:
+                prev.next = current.next
+                self._length -= 1
+            else:
+                seen.add(current.data)
+                prev = current
+            current = current.next
+        self.tail = prev
+
+    def splice(self, other):
+        """Прицепляет все узлы other в конец за O(1); other становится пустым"""
+        if other is self or not other.head:
+            return
+        if self.head:
+            self.tail.next = other.head
+        else:
+            self.head = other.head
+        self.tail = other.tail
+        self._length += other._length
+        other.head = other.tail = None
+        other._length = 0
+
+    def split_at(self, k):
+        """
+        Отрезает узлы начиная с индекса k в новый список и возвращает его.
+        В self остаются первые k элементов. O(k)
+        """
+        if k < 0 or k > self._length:
+            raise IndexError("split index out of range")
+        other = SimpleLinkedList()
+        if k == self._length:
+            return other
+        if k == 0:
+            other.splice(self)
+            return other
+        prev = self.head
+        for _ in range(k - 1):
+            prev = prev.next
+        other.head = prev.next
+        other.tail = self.tail
+        other._length = self._length - k
+        prev.next = None
+        self.tail = prev
+        self._length = k
+        return other
+
     def __str__(self):
-        elements = []
+        return " -> ".join(map(str, self))
+
+
+class UnrolledLinkedList:
+    """
+    Развёрнутый связный список: каждый узел хранит не один элемент,
+    а массив до node_capacity элементов. Меньше объектов-узлов и указателей,
+    поиск внутри узла идёт на C (list.index), обход дружелюбнее к кэшу.
+    Узел делится пополам при переполнении и сливается с соседом,
+    если заполнен меньше чем наполовину.
+    """
+
+    class Node:
+        __slots__ = ("items", "next")
+
+        def __init__(self, items=None):
+            self.items = items if items is not None else []
+            self.next = None
+
+    def __init__(self, node_capacity=64):
+        if node_capacity < 2:
+            raise ValueError("node_capacity must be at least 2")
+        self._node_capacity = node_capacity
+        self._min_fill = node_capacity // 2
+        self.head = None
+        self.tail = None
+        self._length = 0
+
+    def __len__(self):
+        return self._length
+
+    def __iter__(self):
         current = self.head
         while current:
-            elements.append(str(current.data))
+            yield from current.items
             current = current.next
-        return " -> ".join(elements)
+
+    def _split(self, node):
+        """Переносит вторую половину узла в новый узел сразу за ним"""
+        half = len(node.items) // 2
+        new_node = self.Node(node.items[half:])
+        del node.items[half:]
+        new_node.next = node.next
+        node.next = new_node
+        if node is self.tail:
+            self.tail = new_node
+        return new_node
+
+    def append(self, data):
+        if self.tail is None:
+            self.head = self.tail = self.Node()
+        elif len(self.tail.items) >= self._node_capacity:
+            new_node = self.Node()
+            self.tail.next = new_node
+            self.tail = new_node
+        self.tail.items.append(data)
+        self._length += 1
+
+    def extend(self, iterable):
+        for data in iterable:
+            self.append(data)
+
+    def insert_front(self, data):
+        self.insert(0, data)
+
+    def insert(self, index, data):
+        if index < 0 or index > self._length:
+            raise IndexError("Index out of bounds for insert")
+        if index == self._length:
+            self.append(data)
+            return
+        node = self.head
+        while index > len(node.items):
+            index -= len(node.items)
+            node = node.next
+        if len(node.items) >= self._node_capacity:
+            new_node = self._split(node)
+            if index > len(node.items):
+                index -= len(node.items)
+                node = new_node
+        node.items.insert(index, data)
+        self._length += 1
+
+    def remove(self, data):
+        prev = None
+        node = self.head
+        while node:
+            try:
+                pos = node.items.index(data)
+            except ValueError:
+                prev = node
+                node = node.next
+                continue
+            del node.items[pos]
+            self._length -= 1
+            self._rebalance(prev, node)
+            return True
+        return False
+
+    def _rebalance(self, prev, node):
+        """Сливает недозаполненный узел со следующим или удаляет пустой"""
+        if not node.items:
+            if prev:
+                prev.next = node.next
+            else:
+                self.head = node.next
+            if node is self.tail:
+                self.tail = prev
+            return
+        following = node.next
+        if (following and len(node.items) < self._min_fill
+                and len(node.items) + len(following.items) <= self._node_capacity):
+            node.items.extend(following.items)
+            node.next = following.next
+            if following is self.tail:
+                self.tail = node
+
+    def search(self, data):
+        offset = 0
+        node = self.head
+        while node:
+            try:
+                return offset + node.items.index(data)
+            except ValueError:
+                offset += len(node.items)
+                node = node.next
+        return -1
+
+    def __str__(self):
+        return " -> ".join(map(str, self))
+
+
+def benchmark(n=200000):
+    """Память и скорость: SimpleLinkedList, DoublyLinkedList и UnrolledLinkedList"""
+    import gc
+    import time
+    import tracemalloc
+    from prk_4 import DoublyLinkedList
+
+    for cls in (SimpleLinkedList, DoublyLinkedList, UnrolledLinkedList):
+        # память — отдельной сборкой: под tracemalloc каждое выделение в разы дороже,
+        # поэтому время замеряется только без трассировки
+        gc.collect()
+        tracemalloc.start()
+        lst = cls()
+        for i in range(n):
+            lst.append(i)
+        memory = tracemalloc.get_traced_memory()[0]
+        tracemalloc.stop()
+        del lst
+        gc.collect()
+
+        lst = cls()
+        start = time.time()
+        for i in range(n):
+            lst.append(i)
+        build = time.time() - start
+
+        start = time.time()
+        total = 0
+        for x in lst:
+            total += x
+        iterate = time.time() - start
+
+        search = getattr(lst, "search", None) or lst.find
+        start = time.time()
+        for target in (n // 2, n - 1, -1):
+            search(target)
+        lookup = time.time() - start
+
+        print(f"{cls.__name__:>18}: память {memory / n:6.1f} Б/элемент, "
+              f"append {build:.4f} сек, обход {iterate:.4f} сек, 3 поиска {lookup:.4f} сек")
 
 
 if __name__ == "__main__":
@@ -80,7 +393,29 @@ if __name__ == "__main__":
     lst.append(2)
     lst.append(3)
     lst.insert_front(0)
-    print(f"Список: {lst}")
+    lst.extend([4, 5])
+    print(f"Список: {lst}, длина: {len(lst)}")
     print(f"Поиск 2: {lst.search(2)}")
     lst.reverse()
-    print(f"После разворота: {lst}")
\ No newline at end of file
+    print(f"После разворота: {lst}")
+
+    other = SimpleLinkedList()
+    other.extend([3, 1, 2, 3, 0])
+    lst.splice(other)
+    print(f"После splice: {lst}")
+    lst.sort()
+    print(f"После sort: {lst}")
+    lst.dedup()
+    print(f"После dedup: {lst}")
+    tail = lst.split_at(3)
+    print(f"split_at(3): {lst} | {tail}")
+
+    ul = UnrolledLinkedList(node_capacity=4)
+    ul.extend(range(10))
+    ul.insert_front(-1)
+    ul.insert(5, 42)
+    ul.remove(7)
+    print(f"\nUnrolledLinkedList: {ul}, поиск 42: {ul.search(42)}")
+
+    print("\nСравнение памяти и скорости:")
+    benchmark()
@@ -1,3 +1,10 @@
+import functools
+import sys
+import time
+from array import array
+from collections import OrderedDict
+
+
 class Node:
     def __init__(self, data):
         self.data = data
@@ -6,10 +13,58 @@ class Node:
 
 
 class DoublyLinkedList:
-    def __init__(self):
+    def __init__(self, indexed=False):
+        """
+        indexed=True — поддерживать словарь значение → узлы, чтобы find/remove
+        работали за O(1) в среднем вместо линейного прохода.
+        Значения при этом должны быть хэшируемыми.
+        """
         self.head = None
         self.tail = None
         self.length = 0
+        self._index = {} if indexed else None
+
+    def _index_add(self, node, front=False, after=None):
+        """
+        Вызывается до связывания узла: нехэшируемое значение бросает TypeError,
+        не оставляя в списке неиндексированного узла.
+        Узлы с одинаковым значением хранятся в том же порядке, что и в списке:
+        front=True — узел станет головой; after — узел встаёт сразу за этим узлом.
+        """
+        if self._index is None:
+            return
+        nodes = self._index.get(node.data)
+        if nodes is None:
+            self._index[node.data] = {node: None}
+            return
+        if after is not None:
+            # ближайший предшественник с тем же значением; O(расстояние до него)
+            while after is not None and after not in nodes:
+                after = after.prev
+            if after is None:
+                front = True
+        if front:
+            self._index[node.data] = {node: None, **nodes}
+        elif after is None or after is self._last(nodes):
+            nodes[node] = None
+        else:
+            ordered = {}
+            for other in nodes:
+                ordered[other] = None
+                if other is after:
+                    ordered[node] = None
+            self._index[node.data] = ordered
+
+    @staticmethod
+    def _last(nodes):
+        return next(reversed(nodes))
+
+    def _index_discard(self, node):
+        if self._index is not None:
+            nodes = self._index[node.data]
+            del nodes[node]
+            if not nodes:
+                del self._index[node.data]
 
     def __len__(self):
         return self.length
@@ -30,6 +85,7 @@ class DoublyLinkedList:
 
     def append(self, data):
         node = Node(data)
+        self._index_add(node)
         if not self.head:
             self.head = self.tail = node
         else:
@@ -41,6 +97,7 @@ class DoublyLinkedList:
 
     def insert_front(self, data):
         node = Node(data)
+        self._index_add(node, front=True)
         if not self.head:
             self.head = self.tail = node
         else:
@@ -54,6 +111,7 @@ class DoublyLinkedList:
         if not node: return
 
         new_node = Node(data)
+        self._index_add(new_node, after=node)
         new_node.prev = node
         new_node.next = node.next
 
@@ -82,9 +140,17 @@ class DoublyLinkedList:
 
         node.next = node.prev = None
         self.length -= 1
+        self._index_discard(node)
         return node.data
 
     def find(self, data):
+        """
+        В индексированном режиме — O(1); как и без индекса, при повторяющихся
+        значениях возвращается первый по порядку списка узел.
+        """
+        if self._index is not None:
+            nodes = self._index.get(data)
+            return next(iter(nodes)) if nodes else None
         current = self.head
         while current:
             if current.data == data:
@@ -96,6 +162,26 @@ class DoublyLinkedList:
         node = self.find(data)
         return self.remove_node(node) if node else None
 
+    def move_to_front(self, node):
+        """Перевешивает узел в начало списка без создания нового узла. O(1)"""
+        if node is self.head:
+            return node
+        if self._index is not None:
+            nodes = self._index[node.data]
+            if len(nodes) > 1:
+                del nodes[node]
+                self._index[node.data] = {node: None, **nodes}
+        node.prev.next = node.next
+        if node.next:
+            node.next.prev = node.prev
+        else:
+            self.tail = node.prev
+        node.prev = None
+        node.next = self.head
+        self.head.prev = node
+        self.head = node
+        return node
+
     class Iterator:
         def __init__(self, start, reverse=False):
             self.current = start
@@ -114,6 +200,360 @@ class DoublyLinkedList:
     def reverse_iter(self):
         return self.Iterator(self.tail, reverse=True)
 
+NIL = -1
+
+
+class CompactDoublyLinkedList:
+    """
+    Двусвязный список на параллельных массивах: data[i], prev[i], next[i].
+    Узел — это целочисленный индекс (дескриптор), а не объект Python.
+    Удалённые ячейки попадают в список свободных и переиспользуются,
+    поэтому при постоянной вставке/удалении нет аллокаций и работы для GC.
+    """
+
+    def __init__(self, capacity=0):
+        self._data = [None] * capacity
+        self._prev = array("q", [NIL]) * capacity
+        self._next = array("q", range(1, capacity + 1))
+        if capacity:
+            self._next[-1] = NIL
+        self._free = 0 if capacity else NIL
+        self.head = NIL
+        self.tail = NIL
+        self.length = 0
+
+    def __len__(self):
+        return self.length
+
+    def __iter__(self):
+        data, nxt = self._data, self._next
+        current = self.head
+        while current != NIL:
+            yield data[current]
+            current = nxt[current]
+
+    def reverse_iter(self):
+        data, prev = self._data, self._prev
+        current = self.tail
+        while current != NIL:
+            yield data[current]
+            current = prev[current]
+
+    def __repr__(self):
+        items = [str(x) for x in self]
+        return " <-> ".join(items) if items else "Empty"
+
+    def get(self, handle):
+        return self._data[handle]
+
+    def _alloc(self, data):
+        handle = self._free
+        if handle == NIL:
+            handle = len(self._data)
+            self._data.append(data)
+            self._prev.append(NIL)
+            self._next.append(NIL)
+        else:
+            self._free = self._next[handle]
+            self._data[handle] = data
+        return handle
+
+    def _link(self, handle, prev, nxt):
+        self._prev[handle] = prev
+        self._next[handle] = nxt
+        if prev != NIL:
+            self._next[prev] = handle
+        else:
+            self.head = handle
+        if nxt != NIL:
+            self._prev[nxt] = handle
+        else:
+            self.tail = handle
+        self.length += 1
+        return handle
+
+    def append(self, data):
+        return self._link(self._alloc(data), self.tail, NIL)
+
+    def insert_front(self, data):
+        return self._link(self._alloc(data), NIL, self.head)
+
+    def insert_after(self, handle, data):
+        if handle == NIL:
+            return NIL
+        return self._link(self._alloc(data), handle, self._next[handle])
+
+    def remove_node(self, handle):
+        if handle == NIL:
+            return None
+        prev, nxt = self._prev[handle], self._next[handle]
+        if prev != NIL:
+            self._next[prev] = nxt
+        else:
+            self.head = nxt
+        if nxt != NIL:
+            self._prev[nxt] = prev
+        else:
+            self.tail = prev
+
+        data = self._data[handle]
+        self._data[handle] = None
+        self._prev[handle] = NIL
+        self._next[handle] = self._free
+        self._free = handle
+        self.length -= 1
+        return data
+
+    def find(self, data):
+        values, nxt = self._data, self._next
+        current = self.head
+        while current != NIL:
+            if values[current] == data:
+                return current
+            current = nxt[current]
+        return NIL
+
+    def remove(self, data):
+        handle = self.find(data)
+        return self.remove_node(handle) if handle != NIL else None
+
+
+class _CacheEntry:
+    __slots__ = ("key", "value", "size", "expires", "freq")
+
+    def __init__(self, key, value, size, expires):
+        self.key = key
+        self.value = value
+        self.size = size
+        self.expires = expires
+        self.freq = 1
+
+
+class _BaseCache:
+    """
+    Общая часть LRU/LFU-кэшей: словарь ключ → узел двусвязного списка,
+    лимиты по числу записей и по байтам, TTL и счётчики.
+    Порядок вытеснения задают наследники через _link/_unlink/_touch/_victim.
+    """
+
+    def __init__(self, max_entries=None, max_bytes=None, ttl=None,
+                 sizeof=sys.getsizeof, clock=time.monotonic):
+        if max_entries is not None and max_entries <= 0:
+            raise ValueError("max_entries must be positive")
+        if max_bytes is not None and max_bytes <= 0:
+            raise ValueError("max_bytes must be positive")
+        self._map = {}
+        # при общем ttl записи истекают в порядке вставки: ключи в этом порядке
+        self._expiry = OrderedDict()
+        self._max_entries = max_entries
+        self._max_bytes = max_bytes
+        self._ttl = ttl
+        self._sizeof = sizeof
+        self._clock = clock
+        self._bytes = 0
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self.expirations = 0
+
+    def __len__(self):
+        self._purge_expired()
+        return len(self._map)
+
+    def __contains__(self, key):
+        node = self._map.get(key)
+        return node is not None and not self._expired(node.data)
+
+    def _expired(self, entry):
+        return entry.expires is not None and entry.expires <= self._clock()
+
+    def _purge_expired(self):
+        """Удаляет все истёкшие записи; O(1) на каждую удалённую запись"""
+        if not self._expiry:
+            return
+        now = self._clock()
+        while self._expiry:
+            node = self._map[next(iter(self._expiry))]
+            if node.data.expires > now:
+                break
+            self._discard(node)
+            self.expirations += 1
+
+    def _discard(self, node):
+        self._unlink(node)
+        entry = node.data
+        del self._map[entry.key]
+        if entry.expires is not None:
+            del self._expiry[entry.key]
+        self._bytes -= entry.size
+
+    def get(self, key, default=None):
+        node = self._map.get(key)
+        if node is None:
+            self.misses += 1
+            return default
+        if self._expired(node.data):
+            self._discard(node)
+            self.expirations += 1
+            self.misses += 1
+            return default
+        self.hits += 1
+        self._map[key] = self._touch(node)
+        return node.data.value
+
+    def put(self, key, value):
+        size = self._sizeof(value) if self._max_bytes is not None else 0
+        expires = self._clock() + self._ttl if self._ttl is not None else None
+
+        node = self._map.get(key)
+        if node is not None:
+            self._discard(node)
+        if self._max_bytes is not None and size > self._max_bytes:
+            return
+
+        self._make_room(size)
+        entry = _CacheEntry(key, value, size, expires)
+        if node is not None:
+            entry.freq = node.data.freq
+        self._map[key] = self._link(entry)
+        if expires is not None:
+            self._expiry[key] = None
+        self._bytes += size
+
+    def remove(self, key):
+        node = self._map.get(key)
+        if node is None:
+            raise KeyError(key)
+        self._discard(node)
+        return node.data.value
+
+    def clear(self):
+        for node in list(self._map.values()):
+            self._discard(node)
+
+    def _over_limit(self, size):
+        return ((self._max_entries is not None and len(self._map) >= self._max_entries) or
+                (self._max_bytes is not None and self._bytes + size > self._max_bytes))
+
+    def _make_room(self, size):
+        """
+        Вытесняет записи до вставки новой, чтобы она сама не стала жертвой.
+        Сначала освобождаются истёкшие записи, и только потом — живые по LRU/LFU.
+        """
+        if self._expiry and self._over_limit(size):
+            self._purge_expired()
+        while self._map and self._over_limit(size):
+            self._discard(self._victim())
+            self.evictions += 1
+
+    def stats(self):
+        self._purge_expired()
+        return {
+            "size": len(self._map),
+            "bytes": self._bytes,
+            "hits": self.hits,
+            "misses": self.misses,
+            "evictions": self.evictions,
+            "expirations": self.expirations,
+        }
+
+
+class LRUCache(_BaseCache):
+    """
+    LRU-кэш: самые свежие записи в начале списка, вытесняется хвост.
+    get/put — O(1): словарь даёт узел, move_to_front перевешивает его.
+    """
+
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self._order = DoublyLinkedList()
+
+    def _link(self, entry):
+        return self._order.insert_front(entry)
+
+    def _unlink(self, node):
+        self._order.remove_node(node)
+
+    def _touch(self, node):
+        return self._order.move_to_front(node)
+
+    def _victim(self):
+        return self._order.tail
+
+
+class LFUCache(_BaseCache):
+    """
+    LFU-кэш: для каждой частоты обращений свой двусвязный список,
+    вытесняется самая давняя запись среди наименее используемых. get/put — O(1):
+    минимальная частота поддерживается без поиска (после get — freq + 1, после
+    вставки — 1). Только если её список опустел из-за remove/TTL/повторного
+    вытеснения подряд, минимум один раз ищется заново в _victim.
+    """
+
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self._freqs = {}
+        self._min_freq = 0  # 0 — минимум неизвестен
+
+    def _link(self, entry):
+        freq = entry.freq
+        bucket = self._freqs.get(freq)
+        if bucket is None:
+            bucket = self._freqs[freq] = DoublyLinkedList()
+        if freq == 1 or len(self._freqs) == 1 or (self._min_freq and freq < self._min_freq):
+            self._min_freq = freq
+        return bucket.insert_front(entry)
+
+    def _unlink(self, node):
+        freq = node.data.freq
+        bucket = self._freqs[freq]
+        bucket.remove_node(node)
+        if not bucket.length:
+            del self._freqs[freq]
+            if freq == self._min_freq:
+                self._min_freq = 0
+
+    def _touch(self, node):
+        entry = node.data
+        freq = entry.freq
+        last_of_min = freq == self._min_freq and self._freqs[freq].length == 1
+        self._unlink(node)
+        entry.freq = freq + 1
+        node = self._link(entry)
+        if last_of_min:
+            self._min_freq = freq + 1
+        return node
+
+    def _victim(self):
+        if not self._min_freq:
+            self._min_freq = min(self._freqs)
+        return self._freqs[self._min_freq].tail
+
+
+def memoize(cache):
+    """
+    Декоратор: кэширует результаты функции в переданном кэше (LRUCache/LFUCache).
+    Аргументы должны быть хэшируемыми.
+    """
+    missing = object()
+    kwargs_mark = object()  # отделяет kwargs от args, чтобы f(a=1) и f((), ...) не делили ключ
+
+    def decorator(func):
+        @functools.wraps(func)
+        def wrapper(*args, **kwargs):
+            key = args + (kwargs_mark, frozenset(kwargs.items())) if kwargs else args
+            result = cache.get(key, missing)
+            if result is missing:
+                result = func(*args, **kwargs)
+                cache.put(key, result)
+            return result
+
+        wrapper.cache = cache
+        return wrapper
+
+    return decorator
+
+
 def test():
     print("Тест двусвязного списка")
     print("=" * 40)
@@ -165,14 +605,83 @@ def compare():
     start = time.time()
     for _ in range(1000):
         if nodes:
-            node = random.choice(nodes)
+            i = random.randrange(len(nodes))
+            node = nodes[i]
+            nodes[i] = nodes[-1]
+            nodes.pop()
             dll.remove_node(node)
-            nodes.remove(node)
     print(f"1000 удалений случайных узлов: {time.time() - start:.4f} сек")
 
+    for indexed in (False, True):
+        dll = DoublyLinkedList(indexed=indexed)
+        for i in range(10000):
+            dll.append(i)
+        start = time.time()
+        for _ in range(1000):
+            value = random.randrange(10000)
+            if dll.remove(value) is not None:
+                dll.append(value)
+        print(f"1000 remove/append по значению (indexed={indexed}): {time.time() - start:.4f} сек")
+
+
+def compare_compact(n=100000, churn=200000):
+    """Память и скорость «churn»-нагрузки: объектные узлы против параллельных массивов"""
+    import gc
+    import random
+    import tracemalloc
+
+    for cls in (DoublyLinkedList, CompactDoublyLinkedList):
+        gc.collect()
+        tracemalloc.start()
+        lst = cls()
+        handles = [lst.append(i) for i in range(n)]
+        memory = tracemalloc.get_traced_memory()[0]
+        tracemalloc.stop()
+
+        start = time.time()
+        for i in range(churn):
+            j = random.randrange(n)
+            lst.remove_node(handles[j])
+            handles[j] = lst.append(i)
+        elapsed = time.time() - start
+
+        print(f"{cls.__name__:>24}: память {memory / n:6.1f} Б/элемент, "
+              f"{churn} удалений+вставок {elapsed:.4f} сек")
+
+
+def test_cache():
+    print("Тест LRU/LFU-кэша")
+    print("=" * 40)
+
+    lru = LRUCache(max_entries=2)
+    lru.put("a", 1)
+    lru.put("b", 2)
+    lru.get("a")
+    lru.put("c", 3)
+    print(f"LRU после вытеснения: a={lru.get('a')}, b={lru.get('b')}, c={lru.get('c')}")
+    print(f"Статистика: {lru.stats()}")
+
+    lfu = LFUCache(max_entries=2)
+    lfu.put("a", 1)
+    lfu.put("b", 2)
+    lfu.get("a")
+    lfu.get("a")
+    lfu.get("b")
+    lfu.put("c", 3)
+    print(f"LFU после вытеснения: a={lfu.get('a')}, b={lfu.get('b')}, c={lfu.get('c')}")
+
+    @memoize(LRUCache(max_entries=128))
+    def fib(n):
+        return n if n < 2 else fib(n - 1) + fib(n - 2)
+
+    print(f"fib(80) = {fib(80)}, {fib.cache.stats()}")
+
 
 if __name__ == "__main__":
     test()
     print("\n" + "=" * 40)
+    test_cache()
+    print("\n" + "=" * 40)
     print("Сравнение производительности:")
-    compare()
\ No newline at end of file
+    compare()
+    compare_compact()
@@ -1,3 +1,11 @@
+import mmap
+import os
+import re
+import threading
+import time
+from typing import NamedTuple, Optional
+
+
 class StackArray:
     def __init__(self):
         self._data = []
@@ -69,6 +77,196 @@ class StackLinkedList:
         return f"StackLinkedList: {vals[::-1]}"
 
 
+class ConcurrentStack:
+    """
+    Потокобезопасный стек с блокирующим pop. Сами операции со списком не берут
+    блокировку: list.append/extend/pop атомарны в CPython (как в AtomicStack).
+    Блокировка с Condition нужна только спящим потребителям: производитель
+    берёт её, лишь если кто-то ждёт (_waiters), так что без ожидающих
+    push/pop стоят столько же, сколько в AtomicStack.
+    Ожидающий увеличивает _waiters до проверки списка, поэтому
+    производитель, положивший элемент после этой проверки, обязательно его разбудит.
+    """
+
+    def __init__(self):
+        self._data = []
+        self._lock = threading.Lock()
+        self._not_empty = threading.Condition(self._lock)
+        self._waiters = 0
+
+    def push(self, item):
+        self._data.append(item)
+        if self._waiters:
+            with self._lock:
+                self._not_empty.notify()
+
+    def push_many(self, items):
+        items = list(items)
+        self._data.extend(items)
+        if self._waiters:
+            with self._lock:
+                self._not_empty.notify(len(items))
+
+    def pop(self, block=None, timeout=None):
+        """
+        Без block и timeout — как у StackArray: IndexError на пустом стеке.
+        timeout задан — ждать элемент не дольше timeout секунд;
+        block=True без timeout — ждать бесконечно.
+        """
+        if block is None:
+            block = timeout is not None
+        try:
+            return self._data.pop()
+        except IndexError:
+            if not block:
+                raise IndexError("pop from empty stack") from None
+        deadline = None if timeout is None else time.monotonic() + timeout
+        with self._lock:
+            self._waiters += 1
+            try:
+                while True:
+                    try:
+                        return self._data.pop()
+                    except IndexError:
+                        pass
+                    remaining = None if deadline is None else deadline - time.monotonic()
+                    if remaining is not None and remaining <= 0:
+                        raise IndexError("pop from empty stack")
+                    self._not_empty.wait(remaining)
+            finally:
+                self._waiters -= 1
+
+    def _pop_upto(self, n):
+        batch = []
+        pop = self._data.pop
+        try:
+            for _ in range(n):
+                batch.append(pop())
+        except IndexError:
+            pass
+        return batch
+
+    def pop_many(self, n, block=None, timeout=None):
+        """
+        Снимает до n элементов (вершина — первой) без блокировки; ждёт, как pop,
+        только если стек пуст. block/timeout — как у pop.
+        """
+        if n < 0:
+            raise ValueError("n must be non-negative")
+        if n == 0:
+            return []
+        batch = self._pop_upto(n)
+        if not batch:
+            batch.append(self.pop(block, timeout))
+            batch.extend(self._pop_upto(n - 1))
+        return batch
+
+    def peek(self):
+        try:
+            return self._data[-1]
+        except IndexError:
+            raise IndexError("peek from empty stack") from None
+
+    def is_empty(self):
+        return not self._data
+
+    def size(self):
+        return len(self._data)
+
+    def __str__(self):
+        return f"ConcurrentStack: {self._data[:]}"
+
+
+class AtomicStack(StackArray):
+    """
+    Стек почти без блокировок: в CPython list.append и list.pop атомарны
+    (выполняются под GIL одной операцией), поэтому push/pop не берут lock.
+    Проверка «пусто?» и снятие элемента объединены в один pop,
+    чтобы между ними не вклинился другой поток. Блокирующего ожидания нет.
+    """
+
+    def pop(self):
+        try:
+            return self._data.pop()
+        except IndexError:
+            raise IndexError("pop from empty stack") from None
+
+    def peek(self):
+        try:
+            return self._data[-1]
+        except IndexError:
+            raise IndexError("peek from empty stack") from None
+
+
+class LockedStack:
+    """Базовый вариант для сравнения: StackArray под одной глобальной блокировкой"""
+
+    def __init__(self):
+        self._stack = StackArray()
+        self._lock = threading.Lock()
+
+    def push(self, item):
+        with self._lock:
+            self._stack.push(item)
+
+    def pop(self):
+        with self._lock:
+            return self._stack.pop()
+
+
+def benchmark_contention(threads=4, ops=50000, batch=64):
+    """
+    N производителей и N потребителей, каждый делает ops операций.
+    Печатает операции в секунду для каждой реализации.
+    """
+
+    def spin_pop(stack):
+        while True:
+            try:
+                return stack.pop()
+            except IndexError:
+                time.sleep(0)
+
+    def producer(stack, batched):
+        if batched:
+            for start in range(0, ops, batch):
+                stack.push_many(range(start, min(start + batch, ops)))
+        else:
+            for i in range(ops):
+                stack.push(i)
+
+    def consumer(stack, kind):
+        if kind == "batched":
+            left = ops
+            while left:
+                left -= len(stack.pop_many(min(batch, left), block=True))
+        elif kind == "blocking":
+            for _ in range(ops):
+                stack.pop(block=True)
+        else:
+            for _ in range(ops):
+                spin_pop(stack)
+
+    variants = [
+        ("StackArray + глобальный lock", LockedStack, False, "spin"),
+        ("AtomicStack", AtomicStack, False, "spin"),
+        ("ConcurrentStack", ConcurrentStack, False, "blocking"),
+        (f"ConcurrentStack, пачки по {batch}", ConcurrentStack, True, "batched"),
+    ]
+    for name, cls, batched, kind in variants:
+        stack = cls()
+        workers = [threading.Thread(target=producer, args=(stack, batched)) for _ in range(threads)]
+        workers += [threading.Thread(target=consumer, args=(stack, kind)) for _ in range(threads)]
+        start = time.perf_counter()
+        for w in workers:
+            w.start()
+        for w in workers:
+            w.join()
+        elapsed = time.perf_counter() - start
+        total = 2 * threads * ops
+        print(f"{name:>34}: {total / elapsed:12,.0f} оп/сек")
+
+
 def is_balanced_brackets(s: str) -> bool:
     stack = StackArray()
     pairs = {')': '(', ']': '[', '}': '{'}
@@ -85,6 +283,115 @@ def is_balanced_brackets(s: str) -> bool:
     return stack.is_empty()
 
 
+class BracketMismatch(NamedTuple):
+    """Первая ошибка: смещение и строка (с 1) символа, сам символ и ожидаемая закрывающая"""
+    offset: int
+    line: int
+    char: str
+    expected: Optional[str]
+
+
+_BRACKETS_STR = re.compile(r"[()\[\]{}]")
+_BRACKETS_BYTES = re.compile(rb"[()\[\]{}]")
+_CLOSING = {'(': ')', '[': ']', '{': '}'}
+
+
+def _iter_chunks(source, chunk_size):
+    if isinstance(source, (str, bytes, bytearray, memoryview)):
+        yield source
+    elif hasattr(source, "read"):
+        while True:
+            chunk = source.read(chunk_size)
+            if not chunk:
+                return
+            yield chunk
+    else:
+        yield from source
+
+
+def check_brackets_stream(source, chunk_size=1 << 20) -> Optional[BracketMismatch]:
+    """
+    Потоковая проверка скобок: source — строка/bytes, файловый объект
+    (читается кусками по chunk_size) или итератор кусков.
+    В памяти держится только стек открытых скобок.
+    Куски просматриваются регулярным выражением на C, так что участки
+    без скобок не проходят через цикл Python; строки считаются через str.count.
+    Возвращает None, если всё сбалансировано, иначе BracketMismatch
+    (для bytes смещение в байтах, для str — в символах).
+    """
+    stack = []
+    base = 0
+    line = 1
+    for chunk in _iter_chunks(source, chunk_size):
+        binary = isinstance(chunk, (bytes, bytearray, memoryview))
+        if binary:
+            if isinstance(chunk, memoryview):
+                chunk = chunk.tobytes()  # у memoryview нет count
+            pattern, newline = _BRACKETS_BYTES, b"\n"
+        else:
+            pattern, newline = _BRACKETS_STR, "\n"
+        last = 0
+        for match in pattern.finditer(chunk):
+            pos = match.start()
+            line += chunk.count(newline, last, pos)
+            last = pos
+            ch = match.group()
+            if binary:
+                ch = ch.decode()
+            if ch in _CLOSING:
+                stack.append((ch, base + pos, line))
+            elif not stack:
+                return BracketMismatch(base + pos, line, ch, None)
+            else:
+                opener = stack.pop()[0]
+                if _CLOSING[opener] != ch:
+                    return BracketMismatch(base + pos, line, ch, _CLOSING[opener])
+        line += chunk.count(newline, last)
+        base += len(chunk)
+
+    if stack:
+        ch, offset, line = stack[-1]
+        return BracketMismatch(offset, line, ch, _CLOSING[ch])
+    return None
+
+
+def _line_at(buf, offset, chunk_size):
+    """Номер строки (с 1) для смещения; считается только при ошибке, кусками по chunk_size"""
+    line = 1
+    for i in range(0, offset, chunk_size):
+        line += buf[i:min(i + chunk_size, offset)].count(b"\n")
+    return line
+
+
+def check_brackets_file(path, chunk_size=1 << 20) -> Optional[BracketMismatch]:
+    """
+    Проверка файла через mmap: регулярное выражение идёт прямо по отображению,
+    без копирования кусков; смещения в байтах. Номер строки вычисляется только
+    для найденной ошибки (у mmap нет count, а считать переводы строк по ходу
+    пришлось бы через копии).
+    """
+    with open(path, "rb") as f:
+        if os.fstat(f.fileno()).st_size == 0:
+            return None
+        with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+            stack = []
+            for match in _BRACKETS_BYTES.finditer(mm):
+                pos = match.start()
+                ch = chr(mm[pos])
+                if ch in _CLOSING:
+                    stack.append((ch, pos))
+                elif not stack:
+                    return BracketMismatch(pos, _line_at(mm, pos, chunk_size), ch, None)
+                else:
+                    opener = stack.pop()[0]
+                    if _CLOSING[opener] != ch:
+                        return BracketMismatch(pos, _line_at(mm, pos, chunk_size), ch, _CLOSING[opener])
+            if stack:
+                ch, pos = stack[-1]
+                return BracketMismatch(pos, _line_at(mm, pos, chunk_size), ch, _CLOSING[ch])
+            return None
+
+
 if __name__ == "__main__":
     print("=" * 40)
     print("Тестирование Стека на массиве")
@@ -136,3 +443,23 @@ if __name__ == "__main__":
         status = "робит" if result == expected else "не робит"
         print(f"'{expr}' → {result} (ожидалось {expected}) {status}")
 
+    print("\nПотоковая проверка (куски по 4 символа):")
+    for expr in ("{[()]}\n[{}]", "{\n[(])}", "((\n(", "())"):
+        chunks = (expr[i:i + 4] for i in range(0, len(expr), 4))
+        print(f"{expr!r} → {check_brackets_stream(chunks)}")
+
+    print("\n" + "=" * 40)
+    print("Конкурентные стеки")
+    print("=" * 40)
+
+    stack_cc = ConcurrentStack()
+    stack_cc.push_many([1, 2, 3, 4])
+    print(stack_cc)
+    print(f"pop_many(3): {stack_cc.pop_many(3)}")
+    print(f"pop: {stack_cc.pop()}")
+    try:
+        stack_cc.pop(block=True, timeout=0.1)
+    except IndexError as e:
+        print(f"pop(timeout=0.1) на пустом стеке: {e}")
+
+    benchmark_contention()
@@ -1,28 +1,116 @@
+import asyncio
+import struct
+import threading
+import time
+from multiprocessing import shared_memory
+
+
 class CircularQueue:
-    def __init__(self, capacity=10):
+    def __init__(self, capacity=10, growable=False, overwrite=False):
+        """
+        growable=True — при заполнении ёмкость удваивается (элементы выстраиваются с нуля).
+        overwrite=True — при заполнении затирается самый старый элемент (кольцевой буфер телеметрии).
+        По умолчанию переполнение — OverflowError.
+        """
+        if growable and overwrite:
+            raise ValueError("growable and overwrite are mutually exclusive")
         self._capacity = capacity
         self._data = [None] * capacity
         self._front = 0
         self._rear = -1
         self._size = 0
+        self._growable = growable
+        self._overwrite = overwrite
+
+    def _linear(self):
+        """Элементы от front до rear — не больше двух срезов"""
+        end = self._front + self._size
+        if end <= self._capacity:
+            return self._data[self._front:end]
+        return self._data[self._front:] + self._data[:end - self._capacity]
+
+    def _resize(self, new_capacity):
+        items = self._linear()
+        self._data = items + [None] * (new_capacity - self._size)
+        self._capacity = new_capacity
+        self._front = 0
+        self._rear = self._size - 1
+
+    def _drop_oldest(self, n):
+        self._front = (self._front + n) % self._capacity
+        self._size -= n
 
     def enqueue(self, value):
         if self._size == self._capacity:
-            raise OverflowError("Queue is full")
+            if self._growable:
+                self._resize(max(1, 2 * self._capacity))
+            elif self._overwrite:
+                self._drop_oldest(1)
+            else:
+                raise OverflowError("Queue is full")
         self._rear = (self._rear + 1) % self._capacity
         self._data[self._rear] = value
         self._size += 1
-        # Трудоёмкость: O(1)
+        # Трудоёмкость: O(1), при росте — O(n) амортизированно O(1)
+
+    def enqueue_many(self, values):
+        """
+        Добавляет пачку элементов не более чем двумя срезовыми присваиваниями.
+        Без growable/overwrite пачка, которая не помещается целиком, не добавляется вовсе.
+        """
+        values = list(values)
+        k = len(values)
+        if not k:
+            return
+        if self._size + k > self._capacity:
+            if self._growable:
+                self._resize(max(2 * self._capacity, self._size + k))
+            elif self._overwrite:
+                if k >= self._capacity:
+                    self._data = values[k - self._capacity:]
+                    self._front = 0
+                    self._rear = self._capacity - 1
+                    self._size = self._capacity
+                    return
+                self._drop_oldest(self._size + k - self._capacity)
+            else:
+                raise OverflowError("Queue is full")
+        start = (self._rear + 1) % self._capacity
+        first = min(k, self._capacity - start)
+        self._data[start:start + first] = values[:first]
+        self._data[:k - first] = values[first:]
+        self._rear = (self._rear + k) % self._capacity
+        self._size += k
+        # Трудоёмкость: O(k)
 
     def dequeue(self):
         if self.is_empty():
             raise IndexError("dequeue from empty queue")
         value = self._data[self._front]
+        self._data[self._front] = None
         self._front = (self._front + 1) % self._capacity
         self._size -= 1
         return value
         # Трудоёмкость: O(1)
 
+    def dequeue_many(self, n):
+        """Извлекает до n элементов (не более двух срезов) и возвращает их списком"""
+        if n < 0:
+            raise ValueError("n must be non-negative")
+        n = min(n, self._size)
+        end = self._front + n
+        if end <= self._capacity:
+            items = self._data[self._front:end]
+            self._data[self._front:end] = [None] * n
+        else:
+            wrap = end - self._capacity
+            items = self._data[self._front:] + self._data[:wrap]
+            self._data[self._front:] = [None] * (self._capacity - self._front)
+            self._data[:wrap] = [None] * wrap
+        self._drop_oldest(n)
+        return items
+        # Трудоёмкость: O(n)
+
     def peek(self):
         if self.is_empty():
             raise IndexError("peek from empty queue")
@@ -37,15 +125,311 @@ class CircularQueue:
         return self._size
 
     def __str__(self):
-        if self.is_empty():
-            return "CircularQueue: []"
-        items = []
-        i = self._front
-        for _ in range(self._size):
-            items.append(self._data[i])
-            i = (i + 1) % self._capacity
-        return f"CircularQueue: {items}"
+        return f"CircularQueue: {self._linear()}"
+
+
+
+class BlockingCircularQueue:
+    """
+    Ограниченная потокобезопасная очередь поверх кольцевого буфера CircularQueue.
+    put ждёт свободного места (обратное давление на производителя),
+    get ждёт элемента — без активного опроса is_empty().
+    По истечении timeout: put — OverflowError, get — IndexError.
+    """
+
+    def __init__(self, capacity=10):
+        self._queue = CircularQueue(capacity)
+        self._capacity = capacity
+        self._lock = threading.Lock()
+        self._not_empty = threading.Condition(self._lock)
+        self._not_full = threading.Condition(self._lock)
+
+    def put(self, value, timeout=None):
+        with self._not_full:
+            if not self._not_full.wait_for(lambda: self._queue.size() < self._capacity, timeout):
+                raise OverflowError("Queue is full")
+            self._queue.enqueue(value)
+            self._not_empty.notify()
+
+    def get(self, timeout=None):
+        with self._not_empty:
+            if not self._not_empty.wait_for(lambda: not self._queue.is_empty(), timeout):
+                raise IndexError("dequeue from empty queue")
+            value = self._queue.dequeue()
+            self._not_full.notify()
+            return value
+
+    def get_many(self, n, timeout=None):
+        """Ждёт хотя бы один элемент и забирает до n за один захват блокировки"""
+        with self._not_empty:
+            if not self._not_empty.wait_for(lambda: not self._queue.is_empty(), timeout):
+                raise IndexError("dequeue from empty queue")
+            items = self._queue.dequeue_many(n)
+            self._not_full.notify(len(items))
+            return items
+
+    def is_empty(self):
+        return self._queue.is_empty()
+
+    def size(self):
+        return self._queue.size()
+
+
+class AsyncCircularQueue:
+    """
+    Тот же ограниченный буфер для asyncio: await put / await get
+    приостанавливают корутину вместо блокировки потока.
+    Не потокобезопасна — использовать внутри одного event loop.
+    """
+
+    def __init__(self, capacity=10):
+        self._queue = CircularQueue(capacity)
+        self._capacity = capacity
+        self._lock = asyncio.Lock()
+        self._not_empty = asyncio.Condition(self._lock)
+        self._not_full = asyncio.Condition(self._lock)
+
+    async def put(self, value, timeout=None):
+        async with self._not_full:
+            try:
+                await asyncio.wait_for(
+                    self._not_full.wait_for(lambda: self._queue.size() < self._capacity), timeout)
+            except asyncio.TimeoutError:
+                raise OverflowError("Queue is full") from None
+            self._queue.enqueue(value)
+            self._not_empty.notify()
+
+    async def get(self, timeout=None):
+        async with self._not_empty:
+            try:
+                await asyncio.wait_for(
+                    self._not_empty.wait_for(lambda: not self._queue.is_empty()), timeout)
+            except asyncio.TimeoutError:
+                raise IndexError("dequeue from empty queue") from None
+            value = self._queue.dequeue()
+            self._not_full.notify()
+            return value
+
+    def is_empty(self):
+        return self._queue.is_empty()
+
+    def size(self):
+        return self._queue.size()
+
+
+def demo_pipelines(n=10000, capacity=64):
+    """Производитель → потребитель через блокирующую и asyncio-очереди"""
+    q = BlockingCircularQueue(capacity)
+    total = []
+
+    def consumer():
+        s = 0
+        for _ in range(n):
+            s += q.get()
+        total.append(s)
+
+    start = time.perf_counter()
+    worker = threading.Thread(target=consumer)
+    worker.start()
+    for i in range(n):
+        q.put(i)
+    worker.join()
+    print(f"BlockingCircularQueue: сумма {total[0]}, {n / (time.perf_counter() - start):,.0f} эл/сек")
+
+    async def pipeline():
+        aq = AsyncCircularQueue(capacity)
+
+        async def produce():
+            for i in range(n):
+                await aq.put(i)
+
+        async def consume():
+            s = 0
+            for _ in range(n):
+                s += await aq.get()
+            return s
+
+        _, s = await asyncio.gather(produce(), consume())
+        return s
+
+    start = time.perf_counter()
+    s = asyncio.run(pipeline())
+    print(f"AsyncCircularQueue: сумма {s}, {n / (time.perf_counter() - start):,.0f} эл/сек")
+
+
+class SharedRingBuffer:
+    """
+    Кольцевой буфер в multiprocessing.shared_memory для одного производителя
+    и одного потребителя в разных процессах. Хранит записи фиксированного размера
+    record_size байт (короткие payload дополняются нулями, длина хранится
+    в 4-байтовом префиксе). Интерфейс как у CircularQueue: enqueue/dequeue/peek,
+    плюс пакетные enqueue_many/dequeue_many, копирующие не больше двух срезов.
+
+    Раскладка памяти: [head: u64][tail: u64][capacity слотов по 4 + record_size байт].
+    head пишет только потребитель, tail — только производитель, поэтому
+    блокировки не нужны. Счётчики монотонно растут, индекс слота = счётчик % capacity.
+    Объекты не сериализуются через pickle — копируются только байты.
+    """
+
+    _HEADER = struct.Struct("QQ")
+    _LEN = struct.Struct("I")
+
+    def __init__(self, capacity=1024, record_size=256, name=None, create=True):
+        self._capacity = capacity
+        self._record_size = record_size
+        self._slot = self._LEN.size + record_size
+        size = self._HEADER.size + capacity * self._slot
+        self._shm = shared_memory.SharedMemory(name=name, create=create, size=size if create else 0)
+        self._buf = self._shm.buf
+        if create:
+            self._HEADER.pack_into(self._buf, 0, 0, 0)
+
+    @property
+    def name(self):
+        return self._shm.name
+
+    def attach_args(self):
+        """Аргументы для подключения к этому буферу из другого процесса"""
+        return {"capacity": self._capacity, "record_size": self._record_size,
+                "name": self._shm.name, "create": False}
+
+    def _counters(self):
+        return self._HEADER.unpack_from(self._buf, 0)
+
+    def size(self):
+        head, tail = self._counters()
+        return tail - head
+
+    def is_empty(self):
+        return self.size() == 0
+
+    def is_full(self):
+        return self.size() == self._capacity
+
+    def _pack(self, payload):
+        if len(payload) > self._record_size:
+            raise ValueError(f"payload larger than record_size ({self._record_size})")
+        return self._LEN.pack(len(payload)) + payload + bytes(self._record_size - len(payload))
+
+    def _unpack(self, raw, offset=0):
+        (length,) = self._LEN.unpack_from(raw, offset)
+        start = offset + self._LEN.size
+        return bytes(raw[start:start + length])
+
+    def _write_slots(self, index, blob):
+        """Пишет подряд идущие слоты начиная с index: не больше двух срезов"""
+        count = len(blob) // self._slot
+        base = self._HEADER.size
+        first = min(count, self._capacity - index) * self._slot
+        self._buf[base + index * self._slot:base + index * self._slot + first] = blob[:first]
+        if first < len(blob):
+            self._buf[base:base + len(blob) - first] = blob[first:]
+
+    def _read_slots(self, index, count):
+        base = self._HEADER.size
+        first = min(count, self._capacity - index) * self._slot
+        blob = bytes(self._buf[base + index * self._slot:base + index * self._slot + first])
+        if first < count * self._slot:
+            blob += bytes(self._buf[base:base + count * self._slot - first])
+        return blob
 
+    def enqueue(self, payload):
+        self.enqueue_many([payload])
+
+    def enqueue_many(self, payloads):
+        """Добавляет пачку целиком; если места не хватает — OverflowError"""
+        payloads = list(payloads)
+        head, tail = self._counters()
+        if tail - head + len(payloads) > self._capacity:
+            raise OverflowError("Queue is full")
+        if not payloads:
+            return
+        self._write_slots(tail % self._capacity, b"".join(map(self._pack, payloads)))
+        # tail публикуется после записи данных: потребитель не увидит недописанных слотов
+        struct.pack_into("Q", self._buf, 8, tail + len(payloads))
+
+    def dequeue(self):
+        items = self.dequeue_many(1)
+        if not items:
+            raise IndexError("dequeue from empty queue")
+        return items[0]
+
+    def dequeue_many(self, n):
+        head, tail = self._counters()
+        count = min(n, tail - head)
+        if count <= 0:
+            return []
+        blob = self._read_slots(head % self._capacity, count)
+        struct.pack_into("Q", self._buf, 0, head + count)
+        return [self._unpack(blob, i * self._slot) for i in range(count)]
+
+    def peek(self):
+        head, tail = self._counters()
+        if head == tail:
+            raise IndexError("peek from empty queue")
+        return self._unpack(self._read_slots(head % self._capacity, 1))
+
+    def close(self):
+        self._buf = None
+        self._shm.close()
+
+    def unlink(self):
+        self._shm.unlink()
+
+
+def _shm_consumer(args, n, batch):
+    ring = SharedRingBuffer(**args)
+    received = 0
+    while received < n:
+        items = ring.dequeue_many(batch)
+        if not items:
+            time.sleep(0)
+        received += len(items)
+    ring.close()
+
+
+def _mp_queue_consumer(queue, n):
+    for _ in range(n):
+        queue.get()
+
+
+def benchmark_shared_memory(n=200000, record_size=64, batch=256):
+    """SharedRingBuffer против multiprocessing.Queue: записи по record_size байт"""
+    import multiprocessing
+
+    payload = b"x" * record_size
+
+    ring = SharedRingBuffer(capacity=4 * batch, record_size=record_size)
+    try:
+        consumer = multiprocessing.Process(target=_shm_consumer, args=(ring.attach_args(), n, batch))
+        start = time.perf_counter()
+        consumer.start()
+        sent = 0
+        chunk = [payload] * batch
+        while sent < n:
+            k = min(batch, n - sent)
+            try:
+                ring.enqueue_many(chunk[:k])
+                sent += k
+            except OverflowError:
+                time.sleep(0)
+        consumer.join()
+        shm_time = time.perf_counter() - start
+    finally:
+        ring.close()
+        ring.unlink()
+
+    queue = multiprocessing.Queue(maxsize=4 * batch)
+    consumer = multiprocessing.Process(target=_mp_queue_consumer, args=(queue, n))
+    start = time.perf_counter()
+    consumer.start()
+    for _ in range(n):
+        queue.put(payload)
+    consumer.join()
+    mp_time = time.perf_counter() - start
+
+    print(f"SharedRingBuffer (пачки по {batch}): {n / shm_time:12,.0f} записей/сек")
+    print(f"multiprocessing.Queue:            {n / mp_time:12,.0f} записей/сек")
 
 
 class Stack:
@@ -69,6 +453,23 @@ class Stack:
     def is_empty(self):
         return len(self._items) == 0
 
+    def __len__(self):
+        return len(self._items)
+
+    def push_many(self, items):
+        self._items.extend(items)
+
+    def pop_all(self):
+        """Снимает все элементы разом; список в порядке извлечения (вершина — первой)"""
+        items = self._items[::-1]
+        self._items = []
+        return items
+
+    def transfer_to(self, other):
+        """Перекладывает все элементы в other одним срезом: порядок переворачивается"""
+        other._items.extend(reversed(self._items))
+        self._items = []
+
 
 class QueueTwoStacks:
     """
@@ -79,21 +480,37 @@ class QueueTwoStacks:
     def __init__(self):
         self.in_stack = Stack()
         self.out_stack = Stack()
+        self._size = 0
 
     def _transfer(self):
-        """Переносим элементы из in_stack в out_stack (если out_stack пуст)"""
+        """Переносим элементы из in_stack в out_stack (если out_stack пуст) одним блоком"""
         if self.out_stack.is_empty():
-            while not self.in_stack.is_empty():
-                self.out_stack.push(self.in_stack.pop())
+            self.in_stack.transfer_to(self.out_stack)
 
     def enqueue(self, value):
         self.in_stack.push(value)
+        self._size += 1
         # Трудоёмкость: O(1) всегда
 
+    def enqueue_many(self, values):
+        values = list(values)
+        self.in_stack.push_many(values)
+        self._size += len(values)
+        # Трудоёмкость: O(k)
+
+    def drain(self):
+        """Извлекает все элементы в порядке очереди и опустошает её"""
+        items = self.out_stack.pop_all()
+        items.extend(reversed(self.in_stack.pop_all()))
+        self._size = 0
+        return items
+        # Трудоёмкость: O(n)
+
     def dequeue(self):
         self._transfer()
         if self.out_stack.is_empty():
             raise IndexError("dequeue from empty queue")
+        self._size -= 1
         return self.out_stack.pop()
         # Амортизированная трудоёмкость: O(1)
 
@@ -105,10 +522,41 @@ class QueueTwoStacks:
         # Амортизированная трудоёмкость: O(1)
 
     def is_empty(self):
-        return self.in_stack.is_empty() and self.out_stack.is_empty()
+        return self._size == 0
 
     def size(self):
-        return len(self.in_stack._items) + len(self.out_stack._items)
+        return self._size
+
+
+def benchmark_bursty(total=200000, bursts=(1, 16, 256, 4096)):
+    """
+    Пачка из k enqueue, затем k dequeue — амортизированная стоимость одной операции
+    для QueueTwoStacks, CircularQueue(growable=True) и collections.deque.
+    """
+    from collections import deque
+
+    class DequeQueue:
+        def __init__(self):
+            self._d = deque()
+            self.enqueue = self._d.append
+            self.dequeue = self._d.popleft
+
+    for k in bursts:
+        rounds = max(1, total // k)
+        line = []
+        for name, factory in (("QueueTwoStacks", QueueTwoStacks),
+                              ("CircularQueue", lambda: CircularQueue(16, growable=True)),
+                              ("deque", DequeQueue)):
+            q = factory()
+            start = time.perf_counter()
+            for _ in range(rounds):
+                for i in range(k):
+                    q.enqueue(i)
+                for _ in range(k):
+                    q.dequeue()
+            per_op = (time.perf_counter() - start) / (2 * rounds * k) * 1e9
+            line.append(f"{name} {per_op:6.1f} нс")
+        print(f"пачка {k:5}: " + ", ".join(line))
 
 def test_queue(QueueClass, *args, **kwargs):
     q = QueueClass(*args, **kwargs)
@@ -125,6 +573,43 @@ def test_queue(QueueClass, *args, **kwargs):
     print(f"{QueueClass.__name__} — прошёл все тесты")
 
 
+def benchmark_throughput(n=200000, batch=256):
+    """Пропускная способность CircularQueue по сравнению с collections.deque"""
+    from collections import deque
+
+    q = CircularQueue(capacity=batch)
+    start = time.perf_counter()
+    for i in range(n):
+        q.enqueue(i)
+        q.dequeue()
+    single = time.perf_counter() - start
+
+    d = deque()
+    start = time.perf_counter()
+    for i in range(n):
+        d.append(i)
+        d.popleft()
+    single_deque = time.perf_counter() - start
+
+    chunk = list(range(batch))
+    q = CircularQueue(capacity=batch + batch // 2)
+    start = time.perf_counter()
+    for _ in range(n // batch):
+        q.enqueue_many(chunk)
+        q.dequeue_many(batch)
+    bulk = time.perf_counter() - start
+
+    d = deque()
+    start = time.perf_counter()
+    for _ in range(n // batch):
+        d.extend(chunk)
+        [d.popleft() for _ in range(batch)]
+    bulk_deque = time.perf_counter() - start
+
+    print(f"по одному:  CircularQueue {n / single:12,.0f} эл/сек, deque {n / single_deque:12,.0f} эл/сек")
+    print(f"пачками {batch}: CircularQueue {n / bulk:12,.0f} эл/сек, deque {n / bulk_deque:12,.0f} эл/сек")
+
+
 if __name__ == "__main__":
     print("  Тестирование очередей:\n")
 
@@ -147,4 +632,35 @@ if __name__ == "__main__":
         qs.enqueue(x)
         print(f"Добавили {x}")
     print("Вершина:", qs.peek())
-    print("Извлекаем:", qs.dequeue(), qs.dequeue(), qs.dequeue())
\ No newline at end of file
+    print("Извлекаем:", qs.dequeue(), qs.dequeue(), qs.dequeue())
+
+    print("\n  Пакетные операции и режимы CircularQueue:")
+    gq = CircularQueue(capacity=2, growable=True)
+    gq.enqueue_many(range(5))
+    print("growable после enqueue_many(range(5)):", gq, "ёмкость", gq._capacity)
+    print("dequeue_many(3):", gq.dequeue_many(3))
+    rq = CircularQueue(capacity=3, overwrite=True)
+    for x in range(5):
+        rq.enqueue(x)
+    print("overwrite после 5 enqueue в ёмкость 3:", rq)
+
+    print("\n  Пропускная способность:")
+    benchmark_throughput()
+
+    print("\n  Конвейеры производитель → потребитель:")
+    demo_pipelines()
+
+    print("\n  Межпроцессный кольцевой буфер:")
+    ring = SharedRingBuffer(capacity=4, record_size=16)
+    ring.enqueue_many([b"alpha", b"beta", b"gamma"])
+    print("peek:", ring.peek(), "dequeue_many(2):", ring.dequeue_many(2))
+    ring.close()
+    ring.unlink()
+    benchmark_shared_memory()
+
+    print("\n  QueueTwoStacks: пакетные операции и пачечная нагрузка:")
+    qs.enqueue_many([1, 2, 3])
+    qs.dequeue()
+    qs.enqueue(4)
+    print("size:", qs.size(), "drain:", qs.drain(), "size после drain:", qs.size())
+    benchmark_bursty()
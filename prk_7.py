@@ -1,13 +1,179 @@
+import math
+import operator
 import re
-from typing import List
+import string
+from array import array
+from functools import lru_cache
+from itertools import repeat
+from typing import Dict, List, Optional, Sequence, Tuple
+
+try:
+    import numpy as np
+except ImportError:  # без NumPy пакетный режим работает на списках
+    np = None
+
+
+class ExpressionError(ValueError):
+    """Ошибка разбора выражения; column — позиция символа (с 1)"""
+
+    def __init__(self, message: str, column: int):
+        super().__init__(f"{message} (позиция {column})")
+        self.column = column
+
+
+# Один скомпилированный сканер: пробелы пропускаются самим поиском,
+# любой другой непредусмотренный символ попадает в \S и становится токеном 'bad'.
+# Вид токена: 'num', 'name', 'op', 'lparen', 'rparen', 'comma' или 'bad' — по первому символу;
+# одиночная '.' тоже попадает в \S и считается 'bad'.
+_TOKEN_RE = re.compile(r"\d+\.?\d*|\.\d+|[A-Za-z_]\w*|\S")
+
+_KINDS = {ch: 'num' for ch in '0123456789.'}
+_KINDS.update((ch, 'name') for ch in string.ascii_letters + '_')
+_KINDS.update((ch, 'op') for ch in '+-*/%^')
+_KINDS.update({'(': 'lparen', ')': 'rparen', ',': 'comma'})
+
+
+def _divide(a, b):
+    if b == 0:
+        raise ZeroDivisionError("Деление на ноль")
+    return a / b
+
+
+def _modulo(a, b):
+    if b == 0:
+        raise ZeroDivisionError("Деление на ноль")
+    return a % b
+
+
+BINARY_OPS = {'+': operator.add, '-': operator.sub, '*': operator.mul,
+              '/': _divide, '%': _modulo, '^': math.pow}
+FUNCTIONS = {'sqrt': (1, math.sqrt), 'abs': (1, abs), 'min': (2, min), 'max': (2, max)}
+CONSTANTS = {'pi': math.pi, 'e': math.e}
+
+# '~' — унарный минус; '^' правоассоциативен и связывает сильнее унарного минуса: -2^2 = -4
+_PREC = {'+': 1, '-': 1, '*': 2, '/': 2, '%': 2, '~': 3, '^': 4}
+
+
+def _error(expr: str, index: int, message: str) -> ExpressionError:
+    """Позиция токена вычисляется только при ошибке, чтобы не замедлять разбор"""
+    if index is None:
+        return ExpressionError(message, len(expr) + 1)
+    for i, match in enumerate(_TOKEN_RE.finditer(expr)):
+        if i == index:
+            return ExpressionError(message, match.start() + 1)
+    return ExpressionError(message, len(expr) + 1)
 
 
 def infix_to_postfix(expr: str) -> List[str]:
     """
     Преобразует инфиксное выражение в ОПН (Reverse Polish Notation).
-    Поддерживает: +, -, *, /, (), унарный минус.
+    Поддерживает: +, -, *, /, %, ^, (), унарный минус, переменные (x, y, ...),
+    функции sqrt/abs/min/max и константы pi, e.
+    Ошибки — ExpressionError с позицией символа.
     """
+    tokens = _TOKEN_RE.findall(expr)
+    kinds = _KINDS
+    prec = _PREC
+    output = []
+    push_out = output.append
+    stack = []          # операторы, '(' и вызовы функций вида 'max('
+    calls = []          # для каждой открытой скобки: [число аргументов, индекс имени] или None
+    opened = []         # индексы открытых скобок — для сообщения о несбалансированности
+    expect_operand = True
+    skip_paren = False
+
+    for index, text in enumerate(tokens):
+        kind = kinds.get(text[0], 'bad')
+        if kind == 'num' and text == '.':
+            kind = 'bad'
+        if kind == 'op':
+            if expect_operand:
+                if text == '-':
+                    stack.append('~')
+                    continue
+                if text == '+':
+                    continue
+                raise _error(expr, index, f"Ожидался операнд перед '{text}'")
+            p = prec[text]
+            while stack:
+                top = prec.get(stack[-1])
+                if top is None or top < p or (top == p and text == '^'):
+                    break
+                push_out(stack.pop())
+            stack.append(text)
+            expect_operand = True
+        elif kind == 'num' or kind == 'name':
+            if not expect_operand:
+                raise _error(expr, index, f"Ожидался оператор перед '{text}'")
+            if kind == 'name' and text in FUNCTIONS:
+                if index + 1 == len(tokens) or tokens[index + 1] != '(':
+                    raise _error(expr, index, f"Ожидался '(' после функции {text}")
+                stack.append(text + '(')
+                calls.append([1, index])
+                opened.append(index)
+                skip_paren = True
+                continue
+            if kind == 'name' and index + 1 < len(tokens) and tokens[index + 1] == '(':
+                raise _error(expr, index, f"Неизвестная функция: {text}")
+            push_out(text)
+            expect_operand = False
+        elif kind == 'lparen':
+            if skip_paren:
+                skip_paren = False
+                continue
+            if not expect_operand:
+                raise _error(expr, index, "Ожидался оператор перед '('")
+            stack.append('(')
+            calls.append(None)
+            opened.append(index)
+        elif kind == 'rparen':
+            if expect_operand:
+                raise _error(expr, index, "Ожидался операнд перед ')'")
+            while stack and stack[-1][-1] != '(':
+                push_out(stack.pop())
+            if not stack:
+                raise _error(expr, index, "Несбалансированные скобки")
+            top = stack.pop()
+            opened.pop()
+            call = calls.pop()
+            if call is not None:
+                name = top[:-1]
+                arity = FUNCTIONS[name][0]
+                if call[0] != arity:
+                    raise _error(expr, call[1],
+                                 f"Функция {name} ожидает аргументов: {arity}, передано: {call[0]}")
+                push_out(name)
+        elif kind == 'comma':
+            if expect_operand:
+                raise _error(expr, index, "Ожидался операнд перед ','")
+            while stack and stack[-1][-1] != '(':
+                push_out(stack.pop())
+            if not stack or calls[-1] is None:
+                raise _error(expr, index, "Запятая вне вызова функции")
+            calls[-1][0] += 1
+            expect_operand = True
+        else:
+            raise _error(expr, index, f"Неизвестный символ '{text}'")
 
+    if expect_operand:
+        raise _error(expr, None, "Неожиданный конец выражения")
+    if opened:
+        raise _error(expr, opened[-1], "Несбалансированные скобки")
+    stack.reverse()
+    output.extend(stack)
+    return output
+
+
+def evaluate_postfix(postfix: List[str], variables: Optional[Dict[str, float]] = None) -> float:
+    """
+    Вычисляет значение выражения в ОПН.
+    variables — значения переменных, встречающихся в выражении.
+    """
+    return CompiledExpression(postfix).evaluate(**(variables or {}))
+
+
+def _legacy_tokenize(expr: str) -> List[str]:
+    """Прежний посимвольный токенизатор — оставлен только для сравнения в benchmark_parse"""
     expr = expr.replace(' ', '')
     tokens = []
     i = 0
@@ -27,91 +193,348 @@ def infix_to_postfix(expr: str) -> List[str]:
             tokens.append(num)
             continue
         i += 1
-
-    output = []
-    stack = []
-    prec = {'+': 1, '-': 1, '*': 2, '/': 2, '~': 3}
     for token in tokens:
-        if re.fullmatch(r'\d+\.?\d*', token):
-            output.append(token)
-        elif token == '~':
-            stack.append(token)
-        elif token in '+-*/':
-            while (stack and stack[-1] != '(' and
-                   stack[-1] in prec and
-                   prec[stack[-1]] >= prec[token]):
-                output.append(stack.pop())
-            stack.append(token)
-        elif token == '(':
-            stack.append(token)
-        elif token == ')':
-            while stack and stack[-1] != '(':
-                output.append(stack.pop())
-            if not stack:
-                raise ValueError("Несбалансированные скобки")
-            stack.pop()
-        else:
+        if not (token in '+-*/()~' or re.fullmatch(r'\d+\.?\d*', token)):
             raise ValueError(f"Неизвестный токен: {token}")
+    return tokens
 
-    while stack:
-        if stack[-1] in '()':
-            raise ValueError("Несбалансированные скобки")
-        output.append(stack.pop())
 
-    return output
+CONST, VAR, UNARY, BINARY, CALL, STORE, LOAD = range(7)
+
+_BATCH_ERRORS = (ArithmeticError, ValueError)
+
+if np is not None:
+    _NUMPY_FUNCS = {
+        operator.add: np.add, operator.sub: np.subtract, operator.mul: np.multiply,
+        _divide: np.true_divide, _modulo: np.mod, math.pow: np.power,
+        math.sqrt: np.sqrt, abs: np.abs, min: np.minimum, max: np.maximum,
+    }
 
-def evaluate_postfix(postfix: List[str]) -> float:
+    def _pow_failed(result, base, exp):
+        """Строки, где math.pow бросил бы ValueError или OverflowError"""
+        base, exp = np.asarray(base), np.asarray(exp)
+        return (((base < 0) & (exp != np.floor(exp))) | ((base == 0) & (exp < 0))
+                | (np.isinf(result) & np.isfinite(base) & np.isfinite(exp)))
+
+    # Строки, в которых скалярное вычисление бросило бы исключение: (результат, *аргументы) → маска
+    _NUMPY_FAILURES = {
+        _divide: lambda result, a, b: np.asarray(b) == 0,
+        _modulo: lambda result, a, b: np.asarray(b) == 0,
+        math.sqrt: lambda result, a: np.asarray(a) < 0,
+        math.pow: _pow_failed,
+    }
+
+
+def optimize_program(program: List[Tuple[int, object]]) -> Tuple[List[Tuple[int, object]], int]:
     """
-    Вычисляет значение выражения в ОПН.
+    Оптимизирует программу стековой машины:
+    - свёртка констант: поддеревья без переменных вычисляются при компиляции
+      (если вычисление бросает исключение, например деление на ноль, поддерево
+      остаётся как есть, чтобы ошибка возникла при вычислении, как и раньше);
+    - удаление пар унарных минусов: -(-x) → x;
+    - устранение общих подвыражений: одинаковые поддеревья объединяются,
+      вычисляются один раз и сохраняются в слот (STORE), повторы читают слот (LOAD).
+    Возвращает (новая программа, число слотов).
     """
-    stack = []
-    for token in postfix:
-        if token == '~':
-            if not stack:
-                raise ValueError("Не хватает операнда для унарного минуса")
-            a = stack.pop()
-            stack.append(-a)
-        elif token in '+-*/':
-            if len(stack) < 2:
-                raise ValueError(f"Не хватает операндов для оператора '{token}'")
-            b = stack.pop()
-            a = stack.pop()
-            if token == '+':
-                stack.append(a + b)
-            elif token == '-':
-                stack.append(a - b)
-            elif token == '*':
-                stack.append(a * b)
-            elif token == '/':
-                if b == 0:
-                    raise ZeroDivisionError("Деление на ноль")
-                stack.append(a / b)
-        else:
+    nodes = []      # (код операции, аргумент, дети)
+    interned = {}   # ключ поддерева → номер узла
+
+    def node(op, arg, children=()):
+        key = (op, repr(arg) if op == CONST else arg, children)
+        nid = interned.get(key)
+        if nid is None:
+            nid = interned[key] = len(nodes)
+            nodes.append((op, arg, children))
+        return nid
 
+    stack = []
+    for op, arg in program:
+        if op == CONST or op == VAR:
+            stack.append(node(op, arg))
+            continue
+        arity = 1 if op == UNARY else 2 if op == BINARY else arg[1]
+        children = tuple(stack[-arity:])
+        del stack[-arity:]
+        if op == UNARY and nodes[children[0]][0] == UNARY:
+            stack.append(nodes[children[0]][2][0])
+            continue
+        if all(nodes[c][0] == CONST for c in children):
+            func = arg[0] if op == CALL else arg
             try:
-                stack.append(float(token))
-            except ValueError:
-                raise ValueError(f"Некорректное число: {token}")
+                value = float(func(*(nodes[c][1] for c in children)))
+            except (ArithmeticError, ValueError, TypeError):
+                pass
+            else:
+                stack.append(node(CONST, value))
+                continue
+        stack.append(node(op, arg, children))
+    root = stack[0]
 
-    if len(stack) != 1:
-        raise ValueError("Некорректное выражение: лишние операнды")
-    return stack[0]
+    uses = [0] * len(nodes)
+    seen = set()
+    pending = [root]
+    while pending:
+        nid = pending.pop()
+        if nid in seen:
+            continue
+        seen.add(nid)
+        for child in nodes[nid][2]:
+            uses[child] += 1
+            pending.append(child)
+
+    optimized = []
+    slots = {}
+    pending = [(root, False)]
+    while pending:
+        nid, expanded = pending.pop()
+        if nid in slots:
+            optimized.append((LOAD, slots[nid]))
+            continue
+        op, arg, children = nodes[nid]
+        if not expanded and children:
+            pending.append((nid, True))
+            pending.extend((child, False) for child in reversed(children))
+            continue
+        optimized.append((op, arg))
+        if children and uses[nid] > 1:
+            slots[nid] = len(slots)
+            optimized.append((STORE, slots[nid]))
+    return optimized, len(slots)
 
 
-def calculate(expr: str) -> float:
+class CompiledExpression:
+    """
+    Выражение, разобранное один раз: хранит ОПН и готовую программу
+    для стековой машины — список (код операции, аргумент).
+    Числа уже переведены в float, операторы — в функции, так что
+    evaluate не разбирает строки и ничего не печатает.
+    optimize=True дополнительно прогоняет программу через optimize_program.
+    """
+
+    def __init__(self, postfix: List[str], optimize: bool = False):
+        self.postfix = postfix
+        self.program = []
+        self.variables = set()
+        self.slots = 0
+        depth = 0
+        for token in postfix:
+            if token == '~':
+                if depth < 1:
+                    raise ValueError("Не хватает операнда для унарного минуса")
+                self.program.append((UNARY, operator.neg))
+            elif token in BINARY_OPS:
+                if depth < 2:
+                    raise ValueError(f"Не хватает операндов для оператора '{token}'")
+                self.program.append((BINARY, BINARY_OPS[token]))
+                depth -= 1
+            elif token in FUNCTIONS:
+                arity, func = FUNCTIONS[token]
+                if depth < arity:
+                    raise ValueError(f"Не хватает аргументов для функции '{token}'")
+                self.program.append((CALL, (func, arity)))
+                depth -= arity - 1
+            elif token in CONSTANTS:
+                self.program.append((CONST, CONSTANTS[token]))
+                depth += 1
+            elif token.isidentifier():
+                self.program.append((VAR, token))
+                self.variables.add(token)
+                depth += 1
+            else:
+                try:
+                    self.program.append((CONST, float(token)))
+                except ValueError:
+                    raise ValueError(f"Некорректное число: {token}")
+                depth += 1
+        if depth != 1:
+            raise ValueError("Некорректное выражение: лишние операнды")
+        if optimize:
+            self.program, self.slots = optimize_program(self.program)
+
+    def evaluate(self, **variables) -> float:
+        stack = []
+        push = stack.append
+        pop = stack.pop
+        slots = [None] * self.slots
+        for op, arg in self.program:
+            if op == CONST:
+                push(arg)
+            elif op == LOAD:
+                push(slots[arg])
+            elif op == STORE:
+                slots[arg] = stack[-1]
+            elif op == VAR:
+                try:
+                    push(variables[arg])
+                except KeyError:
+                    raise ValueError(f"Не задано значение переменной: {arg}") from None
+            elif op == BINARY:
+                b = pop()
+                stack[-1] = arg(stack[-1], b)
+            elif op == UNARY:
+                stack[-1] = arg(stack[-1])
+            else:
+                func, arity = arg
+                if arity == 1:
+                    stack[-1] = func(stack[-1])
+                else:
+                    b = pop()
+                    stack[-1] = func(stack[-1], b)
+        return stack[0]
+
+    __call__ = evaluate
+
+    def evaluate_batch(self, columns: Dict[str, Sequence[float]],
+                       size: Optional[int] = None) -> Tuple[Sequence[float], Sequence[bool]]:
+        """
+        Вычисляет выражение сразу для всех строк: каждый оператор применяется
+        к целому столбцу, а не к одному числу. columns — столбцы значений
+        переменных (list, array.array или массивы NumPy одной длины).
+        size нужен, только если в выражении нет переменных.
+
+        Строки, на которых evaluate бросил бы исключение (деление на ноль, sqrt
+        или ^ вне области определения, переполнение в ^), не прерывают вычисление:
+        в них результат — nan, а сами строки отмечаются во второй возвращаемой маске.
+        С NumPy возвращает (numpy.ndarray, маска numpy), без него — (array('d'), list[bool]).
+        """
+        missing = self.variables - columns.keys()
+        if missing:
+            raise ValueError(f"Не задано значение переменной: {', '.join(sorted(missing))}")
+        lengths = {len(columns[name]) for name in self.variables}
+        if size is not None:
+            lengths.add(size)
+        if len(lengths) != 1:
+            raise ValueError("Столбцы должны быть одной длины")
+        n = lengths.pop()
+        if np is not None:
+            return self._evaluate_numpy(columns, n)
+        return self._evaluate_lists(columns, n)
+
+    def _evaluate_numpy(self, columns, n):
+        failed = np.zeros(n, dtype=bool)
+        stack = []
+        slots = [None] * self.slots
+        with np.errstate(divide='ignore', invalid='ignore', over='ignore'):
+            for op, arg in self.program:
+                if op == CONST:
+                    stack.append(arg)
+                elif op == LOAD:
+                    stack.append(slots[arg])
+                elif op == STORE:
+                    slots[arg] = stack[-1]
+                elif op == VAR:
+                    stack.append(np.asarray(columns[arg], dtype=np.float64))
+                elif op == UNARY:
+                    stack.append(-stack.pop())
+                else:
+                    func, arity = (arg, 2) if op == BINARY else arg
+                    args = stack[-arity:]
+                    del stack[-arity:]
+                    value = _NUMPY_FUNCS[func](*args)
+                    check = _NUMPY_FAILURES.get(func)
+                    if check is not None:
+                        failed |= check(value, *args)
+                    stack.append(value)
+        result = np.broadcast_to(np.asarray(stack[0], dtype=np.float64), (n,)).copy()
+        result[failed] = math.nan
+        return result, failed
+
+    def _evaluate_lists(self, columns, n):
+        failed = [False] * n
+        stack = []
+        slots = [None] * self.slots
+        for op, arg in self.program:
+            if op == CONST:
+                stack.append(arg)
+            elif op == LOAD:
+                stack.append(slots[arg])
+            elif op == STORE:
+                slots[arg] = stack[-1]
+            elif op == VAR:
+                stack.append(columns[arg])
+            else:
+                func, arity = (arg, 1) if op == UNARY else (arg, 2) if op == BINARY else arg
+                args = stack[-arity:]
+                del stack[-arity:]
+                if all(isinstance(a, float) for a in args):
+                    try:
+                        stack.append(func(*args))
+                    except _BATCH_ERRORS:
+                        failed = [True] * n
+                        stack.append(math.nan)
+                    continue
+                try:
+                    stack.append(list(map(func, *self._columns(args, n))))
+                except _BATCH_ERRORS:
+                    # медленный путь только для столбцов, где есть ошибочные строки
+                    values = []
+                    for i, row in enumerate(zip(*self._columns(args, n))):
+                        try:
+                            values.append(func(*row))
+                        except _BATCH_ERRORS:
+                            values.append(math.nan)
+                            failed[i] = True
+                    stack.append(values)
+        result = stack[0]
+        if isinstance(result, float):
+            result = repeat(result, n)
+        result = array('d', result)
+        # min/max и pow(nan, 0) могут «проглотить» nan ошибочной строки
+        for i, bad in enumerate(failed):
+            if bad:
+                result[i] = math.nan
+        return result, failed
+
+    @staticmethod
+    def _columns(args, n):
+        return [repeat(a, n) if isinstance(a, float) else a for a in args]
+
+    def __repr__(self):
+        return f"CompiledExpression({' '.join(self.postfix)!r})"
+
+
+@lru_cache(maxsize=1024)
+def compile(expr: str, optimize: bool = True) -> CompiledExpression:
+    """
+    Разбирает выражение один раз и возвращает переиспользуемый CompiledExpression.
+    Результат кэшируется по тексту выражения (LRU на 1024 выражения).
+    По умолчанию программа оптимизируется (свёртка констант, общие подвыражения).
+    """
+    return CompiledExpression(infix_to_postfix(expr), optimize)
+
+
+def calculate(expr: str, **variables) -> float:
     """
     Принимает инфиксное выражение, возвращает результат.
     """
     try:
-        postfix = infix_to_postfix(expr)
-        print(f"ОПН: {' '.join(postfix)}")
-        result = evaluate_postfix(postfix)
-        return result
+        return compile(expr).evaluate(**variables)
     except Exception as e:
         raise RuntimeError(f"Ошибка в выражении '{expr}': {e}")
 
 
 
+def benchmark_parse(length=100000, repeats=5):
+    """
+    Скорость разбора выражения длиной ~length символов:
+    прежний посимвольный токенизатор против одного прохода скомпилированного
+    сканера, а также полный infix_to_postfix (сканирование + сортировочная станция).
+    """
+    import time
+
+    unit = "12.5 * (345 - 6) / 78 + 9 - "
+    expr = unit * (length // len(unit)) + "1"
+
+    for name, func in (("прежний токенизатор", _legacy_tokenize),
+                       ("сканер _TOKEN_RE", _TOKEN_RE.findall),
+                       ("infix_to_postfix целиком", infix_to_postfix)):
+        start = time.perf_counter()
+        for _ in range(repeats):
+            func(expr)
+        elapsed = (time.perf_counter() - start) / repeats
+        print(f"{name:>26}: {elapsed * 1000:8.2f} мс, {len(expr) / elapsed / 1e6:6.2f} млн симв/сек")
+
+
 if __name__ == "__main__":
     test_cases = [
         "3 + 4 * 2",
@@ -125,20 +548,39 @@ if __name__ == "__main__":
         "(1 + 2.5) * (3 - 1)",
         "3 + 4 * (2 - 1)",
         "((1+2)*3)^2",
+        "2 ^ 3 ^ 2",
+        "-2 ^ 2",
+        "17 % 5 + max(1, min(4, 3)) * sqrt(16)",
+        "2 * pi * abs(-1)",
+        "3 + * 4",
+        "max(1, 2",
+        "2 # 3",
     ]
 
     print("🧮 Тест калькулятора:")
     for expr in test_cases:
-        if '^' in expr:
-            print(f"ошибка  '{expr}' — пропущено (возведение в степень не входит в задание)")
-            continue
         try:
             res = calculate(expr)
-            print(f"истина '{expr}' = {res}")
+            print(f"истина '{expr}' = {res}   ОПН: {' '.join(compile(expr).postfix)}")
         except Exception as e:
             print(f"ложь '{expr}' → Ошибка: {e}")
 
 
+    formula = compile("(x + 1) * (y - 2) / 4")
+    print(f"\n{formula}: x=3, y=10 → {formula(x=3, y=10)}; x=-1, y=0 → {formula(x=-1, y=0)}")
+
+    formula = "(x * 2 + 1) * (x * 2 + 1) + 2 * 3 * 4 - -(-y) + sqrt(16)"
+    plain, optimized = compile(formula, optimize=False), compile(formula)
+    print(f"\n{formula}: операций {len(plain.program)} → {len(optimized.program)}, "
+          f"значение {plain(x=1, y=2)} = {optimized(x=1, y=2)}")
+
+    xs = array('d', range(-2, 3))
+    values, failed = compile("10 / x + y").evaluate_batch({"x": xs, "y": [1.0] * len(xs)})
+    print(f"10 / x + y по столбцам x={list(xs)}: {list(values)}, ошибки: {list(failed)}")
+
+    print("\nСкорость разбора (100k символов):")
+    benchmark_parse()
+
     print("\n" + "="*50)
     print("⌨️  Введите своё выражение (или 'q' для выхода):")
     while True:
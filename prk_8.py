@@ -1,79 +1,226 @@
-from typing import Any, List, Optional, Tuple
+from collections.abc import MutableMapping
+from typing import Any, Iterable, Iterator, List, Optional, Tuple
 
+_MISSING = object()
 
-class HashTable:
-    def __init__(self, initial_capacity: int = 8):
+
+class HashTable(MutableMapping):
+    REHASH_STEP = 4  # сколько непустых корзин переносится за одну операцию при постепенном расширении
+    MIN_CAPACITY = 8
+    SHRINK_RATIO = 0.125  # когда заполнено меньше 1/8 корзин, ёмкость делится пополам, пока это условие держится
+
+    def __init__(self, initial_capacity: int = 8, incremental: bool = False):
+        """
+        incremental=True — расширение без остановки «на весь мир», как в Redis:
+        старый и новый массивы корзин живут одновременно, и каждая операция
+        переносит не больше REHASH_STEP корзин. get/remove смотрят в обе таблицы.
+        Перенос выполняют только операции, меняющие состав ключей (вставка нового
+        ключа, удаление), поэтому чтение и перезапись значения не ломают обход.
+        Пустые корзины в этом режиме хранятся как None и создаются по требованию,
+        чтобы выделение нового массива тоже было дешёвым.
+        """
         self._capacity = initial_capacity
         self._size = 0
+        self._incremental = incremental
+
+        self._buckets: List[Optional[List[Tuple[str, Any]]]] = [[] for _ in range(self._capacity)]
+        self._old_buckets: Optional[List[Optional[List[Tuple[str, Any]]]]] = None
+        self._old_capacity = 0
+        self._rehash_index = 0
+        self._version = 0    # меняется при любом изменении структуры; обход сверяется с ним
+        self._pop_index = 0  # с какой корзины popitem продолжает поиск
+
+    @classmethod
+    def from_items(cls, items: Iterable[Tuple[str, Any]], expected_size: Optional[int] = None,
+                   incremental: bool = False) -> "HashTable":
+        """
+        Строит таблицу из пар (ключ, значение), сразу выделяя ёмкость под expected_size
+        элементов (по умолчанию — len(items), если он есть) — без log(n) расширений.
+        """
+        if expected_size is None and hasattr(items, "__len__"):
+            expected_size = len(items)
+        table = cls(cls._capacity_for(expected_size or 0), incremental)
+        for key, value in items:
+            table.put(key, value)
+        return table
 
-        self._buckets: List[List[Tuple[str, Any]]] = [[] for _ in range(self._capacity)]
+    @classmethod
+    def _capacity_for(cls, n: int) -> int:
+        """Наименьшая ёмкость, при которой n элементов не вызовут расширения"""
+        return max(cls.MIN_CAPACITY, int(n / 0.75) + 1)
 
-    def _hash(self, key: str) -> int:
+    def _hash(self, key: str, capacity: Optional[int] = None) -> int:
         """
         Полиномиальный хэш: h = (s₀·p⁰ + s₁·p¹ + ... + sₙ₋₁·pⁿ⁻¹) mod m
         p = 31 (простое), m = capacity
         """
         p = 31
-        m = self._capacity
+        m = capacity or self._capacity
         hash_val = 0
-        for i, char in enumerate(key):
-            hash_val = (hash_val + ord(char) * (p ** i)) % m
+        power = 1  # pⁱ mod m считается накопительно, без возведения в степень на каждом символе
+        for char in key:
+            hash_val = (hash_val + ord(char) * power) % m
+            power = power * p % m
         return hash_val
 
-    def _find_in_bucket(self, bucket: List[Tuple[str, Any]], key: str) -> Optional[int]:
+    def _find_in_bucket(self, bucket: Optional[List[Tuple[str, Any]]], key: str) -> Optional[int]:
         """Возвращает индекс пары с данным ключом, или None"""
+        if not bucket:
+            return None
         for i, (k, _) in enumerate(bucket):
             if k == key:
                 return i
         return None
 
+    def _old_bucket(self, key: str) -> Optional[List[Tuple[str, Any]]]:
+        """Корзина старой таблицы для ключа, если идёт перенос и она ещё не перенесена"""
+        if self._old_buckets is None:
+            return None
+        return self._old_buckets[self._hash(key, self._old_capacity)]
 
     def put(self, key: str, value: Any) -> None:
 
+        index = self._hash(key)
+        for bucket in (self._buckets[index], self._old_bucket(key)):
+            pos = self._find_in_bucket(bucket, key)
+            if pos is not None:
+
+                bucket[pos] = (key, value)
+                return
+
+        self._version += 1
+        if self._old_buckets is not None:
+            self._rehash_step()
         if self._size >= self._capacity * 0.75:
-            self._resize()
+            if self._incremental:
+                self._start_rehash(self._capacity * 2)
+            else:
+                self._resize(self._capacity * 2)
+            index = self._hash(key)
 
-        index = self._hash(key)
         bucket = self._buckets[index]
+        if bucket is None:
+            bucket = self._buckets[index] = []
+        bucket.append((key, value))
+        self._size += 1
 
-        pos = self._find_in_bucket(bucket, key)
-        if pos is not None:
+    def _lookup(self, key: str, default: Any) -> Any:
+        for bucket in (self._buckets[self._hash(key)], self._old_bucket(key)):
+            pos = self._find_in_bucket(bucket, key)
+            if pos is not None:
+                return bucket[pos][1]
+        return default
 
-            bucket[pos] = (key, value)
-        else:
+    def get(self, key: str, default: Any = None) -> Any:
+        """Как dict.get: для отсутствующего ключа — default; KeyError бросает table[key]"""
+        return self._lookup(key, default)
 
-            bucket.append((key, value))
-            self._size += 1
+    def __getitem__(self, key: str) -> Any:
+        value = self._lookup(key, _MISSING)
+        if value is _MISSING:
+            raise KeyError(f"Key '{key}' not found")
+        return value
 
-    def get(self, key: str) -> Any:
-        index = self._hash(key)
-        bucket = self._buckets[index]
-        pos = self._find_in_bucket(bucket, key)
-        if pos is not None:
-            return bucket[pos][1]
+    def remove(self, key: str) -> None:
+        if self._old_buckets is not None:
+            self._rehash_step()
+        for bucket in (self._buckets[self._hash(key)], self._old_bucket(key)):
+            pos = self._find_in_bucket(bucket, key)
+            if pos is not None:
+                bucket.pop(pos)
+                self._size -= 1
+                self._version += 1
+                self._maybe_shrink()
+                return
         raise KeyError(f"Key '{key}' not found")
 
-    def remove(self, key: str) -> None:
-        index = self._hash(key)
-        bucket = self._buckets[index]
-        pos = self._find_in_bucket(bucket, key)
-        if pos is not None:
-            bucket.pop(pos)
-            self._size -= 1
+    def _maybe_shrink(self) -> None:
+        if (self._old_buckets is not None
+                or self._capacity <= self.MIN_CAPACITY
+                or self._size >= self._capacity * self.SHRINK_RATIO):
+            return
+        capacity = self._capacity
+        while capacity > self.MIN_CAPACITY and self._size < capacity * self.SHRINK_RATIO:
+            capacity //= 2
+        capacity = max(self.MIN_CAPACITY, capacity)
+        if self._incremental:
+            self._start_rehash(capacity)
         else:
-            raise KeyError(f"Key '{key}' not found")
+            self._resize(capacity)
 
-    def _resize(self) -> None:
+    def _resize(self, new_capacity: int) -> None:
+        """Перекладывает все пары в новый массив корзин напрямую, без put и проверок заполнения"""
+        self._finish_rehash()
         old_buckets = self._buckets
-        old_capacity = self._capacity
+        self._version += 1
 
-        self._capacity *= 2
+        self._capacity = new_capacity
         self._buckets = [[] for _ in range(self._capacity)]
-        self._size = 0
 
         for bucket in old_buckets:
+            for pair in bucket or ():
+                self._buckets[self._hash(pair[0])].append(pair)
+
+    def reserve(self, n: int) -> None:
+        """Расширяет таблицу один раз так, чтобы n элементов поместились без расширений"""
+        capacity = self._capacity_for(n)
+        if capacity > self._capacity:
+            self._resize(capacity)
+
+    def update(self, other=(), **kwargs) -> None:
+        """Массовая вставка: ёмкость подбирается один раз по len(other), затем пары вставляются"""
+        if hasattr(other, "__len__"):
+            self.reserve(self._size + len(other) + len(kwargs))
+        items = other.items() if hasattr(other, "items") else other
+        for key, value in items:
+            self.put(key, value)
+        for key, value in kwargs.items():
+            self.put(key, value)
+
+    def _start_rehash(self, new_capacity: int) -> None:
+        """Начинает постепенный перенос: новый массив выделяется без создания корзин"""
+        self._finish_rehash()
+        self._version += 1
+        self._old_buckets = self._buckets
+        self._old_capacity = self._capacity
+        self._rehash_index = 0
+        self._capacity = new_capacity
+        self._buckets = [None] * self._capacity
+
+    def _rehash_step(self, steps: Optional[int] = None) -> None:
+        """
+        Переносит до steps непустых корзин старой таблицы в новую.
+        Пустых корзин за шаг просматривается не больше 10·steps, чтобы длинные
+        пустые участки не давали скачков задержки.
+        """
+        self._version += 1
+        steps = steps or self.REHASH_STEP
+        empty_visits = steps * 10
+        old, buckets = self._old_buckets, self._buckets
+        while steps and self._rehash_index < self._old_capacity:
+            bucket = old[self._rehash_index]
+            old[self._rehash_index] = None
+            self._rehash_index += 1
+            if not bucket:
+                empty_visits -= 1
+                if not empty_visits:
+                    break
+                continue
             for key, value in bucket:
-                self.put(key, value)
+                index = self._hash(key)
+                target = buckets[index]
+                if target is None:
+                    buckets[index] = [(key, value)]
+                else:
+                    target.append((key, value))
+            steps -= 1
+        if self._rehash_index >= self._old_capacity:
+            self._old_buckets = None
+            self._old_capacity = 0
+
+    def _finish_rehash(self) -> None:
+        while self._old_buckets is not None:
+            self._rehash_step(self._old_capacity)
 
     def visualize(self) -> None:
         print(f"\n Хэш-таблица (размер = {self._size}, ёмкость = {self._capacity})")
@@ -84,17 +231,302 @@ class HashTable:
                 print(f"[{i:2}] → {{ {entries} }}")
             else:
                 print(f"[{i:2}] → ∅")
+        if self._old_buckets is not None:
+            print(f"-- идёт перенос: ещё не перенесено корзин старой таблицы "
+                  f"{self._old_capacity - self._rehash_index} из {self._old_capacity}")
         print("=" * 60)
 
     def __len__(self):
         return self._size
 
     def __contains__(self, key: str):
+        return self._lookup(key, _MISSING) is not _MISSING
+
+    def __setitem__(self, key: str, value: Any) -> None:
+        self.put(key, value)
+
+    def __delitem__(self, key: str) -> None:
+        self.remove(key)
+
+    def clear(self) -> None:
+        """Сбрасывает таблицу к начальному состоянию за O(MIN_CAPACITY), без поштучного удаления"""
+        self._capacity = self.MIN_CAPACITY
+        self._size = 0
+        self._buckets = [[] for _ in range(self._capacity)]
+        self._old_buckets = None
+        self._old_capacity = 0
+        self._rehash_index = 0
+        self._pop_index = 0
+        self._version += 1
+
+    def popitem(self) -> Tuple[str, Any]:
+        """
+        Удаляет и возвращает произвольную пару. Поиск непустой корзины продолжается
+        с места прошлого вызова (в старой таблице — с _rehash_index), так что
+        опустошение таблицы через popitem стоит O(n + capacity), а не O(n·capacity).
+        """
+        if not self._size:
+            raise KeyError("popitem(): hash table is empty")
+        self._version += 1
+        bucket = None
+        if self._old_buckets is not None:
+            self._rehash_step()
+        if self._old_buckets is not None:
+            old = self._old_buckets
+            while self._rehash_index < self._old_capacity and not old[self._rehash_index]:
+                old[self._rehash_index] = None
+                self._rehash_index += 1
+            if self._rehash_index < self._old_capacity:
+                bucket = old[self._rehash_index]
+            else:
+                self._old_buckets = None
+                self._old_capacity = 0
+        if bucket is None:
+            buckets = self._buckets
+            i = self._pop_index % self._capacity
+            while not buckets[i]:
+                i = (i + 1) % self._capacity
+            self._pop_index = i
+            bucket = buckets[i]
+        pair = bucket.pop()
+        self._size -= 1
+        self._maybe_shrink()
+        return pair
+
+    def _pairs(self) -> Iterator[Tuple[str, Any]]:
+        """
+        Обходит пары обеих таблиц без построения списка. Как и у dict, изменение
+        состава таблицы во время обхода обнаруживается на следующем шаге итератора.
+        """
+        version = self._version
+        for buckets in (self._buckets, self._old_buckets or ()):
+            for bucket in buckets:
+                if bucket:
+                    for pair in bucket:
+                        yield pair
+                        if self._version != version:
+                            raise RuntimeError("HashTable changed size during iteration")
+
+    def __iter__(self) -> Iterator[str]:
+        for key, _ in self._pairs():
+            yield key
+
+    def items(self) -> Iterator[Tuple[str, Any]]:
+        return self._pairs()
+
+    def values(self) -> Iterator[Any]:
+        for _, value in self._pairs():
+            yield value
+
+
+_MERSENNE = (1 << 61) - 1
+_EMPTY = -1
+_DELETED = -2
+
+
+def polynomial_hash(key: str) -> int:
+    """
+    Тот же полиномиальный хэш (p = 31), но по большому простому модулю 2⁶¹ − 1
+    вместо ёмкости: значение не зависит от размера таблицы, поэтому его можно
+    сохранить и не пересчитывать при расширении.
+    """
+    p = 31
+    hash_val = 0
+    power = 1
+    for char in key:
+        hash_val = (hash_val + ord(char) * power) % _MERSENNE
+        power = power * p % _MERSENNE
+    return hash_val
+
+
+class OpenAddressingHashTable:
+    """
+    Хэш-таблица с открытой адресацией (линейное пробирование).
+    Хэши, ключи и значения лежат в трёх параллельных списках; полный хэш
+    ключа вычисляется один раз и хранится, так что при расширении строки
+    не хэшируются заново, а при поиске сначала сравниваются числа.
+    Удаление оставляет «надгробие» (_DELETED), чтобы не рвать цепочки проб.
+    Ёмкость — степень двойки.
+    """
+
+    def __init__(self, initial_capacity: int = 8):
+        capacity = 8
+        while capacity < initial_capacity:
+            capacity *= 2
+        self._init_slots(capacity)
+        self._size = 0
+
+    def _init_slots(self, capacity: int) -> None:
+        self._capacity = capacity
+        self._mask = capacity - 1
+        self._hashes: List[int] = [_EMPTY] * capacity
+        self._keys: List[Optional[str]] = [None] * capacity
+        self._values: List[Any] = [None] * capacity
+        self._used = 0  # занятые слоты + надгробия
+
+    def _find(self, key: str, h: int) -> int:
+        """Индекс слота с ключом или -1"""
+        hashes, keys, mask = self._hashes, self._keys, self._mask
+        i = h & mask
+        while True:
+            slot_hash = hashes[i]
+            if slot_hash == _EMPTY:
+                return -1
+            if slot_hash == h and keys[i] == key:
+                return i
+            i = (i + 1) & mask
+
+    def put(self, key: str, value: Any) -> None:
+        h = polynomial_hash(key)
+        hashes, mask = self._hashes, self._mask
+        i = h & mask
+        tombstone = -1
+        while True:
+            slot_hash = hashes[i]
+            if slot_hash == _EMPTY:
+                break
+            if slot_hash == _DELETED:
+                if tombstone < 0:
+                    tombstone = i
+            elif slot_hash == h and self._keys[i] == key:
+                self._values[i] = value
+                return
+            i = (i + 1) & mask
+
+        if tombstone >= 0:
+            i = tombstone
+        else:
+            self._used += 1
+        hashes[i] = h
+        self._keys[i] = key
+        self._values[i] = value
+        self._size += 1
+
+        if self._used >= self._capacity * 0.75:
+            self._resize()
+
+    def get(self, key: str) -> Any:
+        i = self._find(key, polynomial_hash(key))
+        if i < 0:
+            raise KeyError(f"Key '{key}' not found")
+        return self._values[i]
+
+    def remove(self, key: str) -> None:
+        i = self._find(key, polynomial_hash(key))
+        if i < 0:
+            raise KeyError(f"Key '{key}' not found")
+        self._hashes[i] = _DELETED
+        self._keys[i] = None
+        self._values[i] = None
+        self._size -= 1
+
+    def _resize(self) -> None:
+        """
+        Перестраивает таблицу по сохранённым хэшам, без вызова put и без проверки
+        коэффициента заполнения на каждом элементе. Если место заняли в основном
+        надгробия, ёмкость не растёт — таблица просто очищается от них.
+        """
+        old = zip(self._hashes, self._keys, self._values)
+        capacity = self._capacity * 2 if self._size >= self._capacity // 2 else self._capacity
+        self._init_slots(capacity)
+        hashes, keys, values, mask = self._hashes, self._keys, self._values, self._mask
+        for h, key, value in old:
+            if h < 0:
+                continue
+            i = h & mask
+            while hashes[i] != _EMPTY:
+                i = (i + 1) & mask
+            hashes[i] = h
+            keys[i] = key
+            values[i] = value
+        self._used = self._size
+
+    def visualize(self) -> None:
+        print(f"\n Открытая адресация (размер = {self._size}, ёмкость = {self._capacity})")
+        print("=" * 60)
+        for i, (h, key, value) in enumerate(zip(self._hashes, self._keys, self._values)):
+            if h == _EMPTY:
+                print(f"[{i:2}] → ∅")
+            elif h == _DELETED:
+                print(f"[{i:2}] → ✝")
+            else:
+                print(f"[{i:2}] → '{key}': {value}  (дом {h & self._mask})")
+        print("=" * 60)
+
+    def __len__(self):
+        return self._size
+
+    def __contains__(self, key: str):
+        return self._find(key, polynomial_hash(key)) >= 0
+
+
+def benchmark(n: int = 50000) -> None:
+    """Вставка, поиск и удаление n строковых ключей: цепочки, открытая адресация, dict"""
+    import time
+
+    keys = [f"key-{i}" for i in range(n)]
+    for name, factory in (("HashTable (цепочки)", HashTable),
+                          ("OpenAddressingHashTable", OpenAddressingHashTable),
+                          ("dict", dict)):
+        table = factory()
+        if isinstance(table, dict):
+            put, get, remove = table.__setitem__, table.__getitem__, table.__delitem__
+        else:
+            put, get, remove = table.put, table.get, table.remove
+
+        start = time.perf_counter()
+        for i, key in enumerate(keys):
+            put(key, i)
+        t_put = time.perf_counter() - start
+
+        start = time.perf_counter()
+        for key in keys:
+            get(key)
+        t_get = time.perf_counter() - start
+
+        start = time.perf_counter()
+        for key in keys:
+            remove(key)
+        t_remove = time.perf_counter() - start
+
+        print(f"{name:>24}: put {t_put:.4f} сек, get {t_get:.4f} сек, remove {t_remove:.4f} сек")
+
+
+def benchmark_resize_latency(n: int = 200000) -> None:
+    """
+    Латентность put при обычном и постепенном расширении HashTable:
+    перцентили и гистограмма по степеням двойки (мкс).
+    Сборщик мусора на время замера отключён, чтобы его паузы не смешивались с расширением.
+    """
+    import gc
+    import time
+
+    keys = [f"key-{i}" for i in range(n)]
+    for incremental in (False, True):
+        table = HashTable(incremental=incremental)
+        latencies = []
+        clock = time.perf_counter_ns
+        gc.disable()
         try:
-            self.get(key)
-            return True
-        except KeyError:
-            return False
+            for i, key in enumerate(keys):
+                start = clock()
+                table.put(key, i)
+                latencies.append(clock() - start)
+        finally:
+            gc.enable()
+
+        latencies.sort()
+        pick = lambda q: latencies[min(n - 1, int(n * q))] / 1000
+        print(f"incremental={incremental}: p50 {pick(0.5):.1f} мкс, p99 {pick(0.99):.1f} мкс, "
+              f"p99.9 {pick(0.999):.1f} мкс, max {latencies[-1] / 1000:.1f} мкс")
+
+        histogram = {}
+        for ns in latencies:
+            bucket = 1 << max(0, (ns // 1000).bit_length())
+            histogram[bucket] = histogram.get(bucket, 0) + 1
+        for bucket in sorted(histogram):
+            print(f"    < {bucket:>8} мкс: {histogram[bucket]}")
+
 
 if __name__ == "__main__":
     ht = HashTable(initial_capacity=4)
@@ -130,4 +562,23 @@ if __name__ == "__main__":
     try:
         ht.remove("kiwi")
     except KeyError as e:
-        print(f"\n⚠Ошибка: {e}")
\ No newline at end of file
+        print(f"\n⚠Ошибка: {e}")
+
+    oa = OpenAddressingHashTable()
+    for key, value in data:
+        oa.put(key, value)
+    oa.remove("date")
+    oa.visualize()
+
+    print("\n Сравнение производительности:")
+    benchmark()
+
+    bulk = HashTable.from_items(data)
+    bulk.update({"kiwi": 80, "lemon": 90})
+    print(f"\n from_items + update: ёмкость {bulk._capacity}, элементы: {dict(bulk.items())}")
+    for key in ["apple", "banana", "cherry", "date", "elderberry", "fig", "grape", "kiwi"]:
+        del bulk[key]
+    print(f" после удалений: {list(bulk)}, ёмкость {bulk._capacity}")
+
+    print("\n Латентность put при расширении:")
+    benchmark_resize_latency()